@@ -0,0 +1,165 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "regions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_categories_id"), "categories", ["id"], unique=False)
+    op.create_index(op.f("ix_categories_name"), "categories", ["name"], unique=True)
+
+    op.create_table(
+        "townships",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("region_id", sa.Integer(), nullable=True),
+        sa.Column("latitude", sa.Float(), nullable=True),
+        sa.Column("longitude", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("default_unit", sa.String(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_items_id"), "items", ["id"], unique=False)
+    op.create_index(op.f("ix_items_name"), "items", ["name"], unique=False)
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("full_name", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("phone_number", sa.String(), nullable=True),
+        sa.Column(
+            "role",
+            sa.Enum("USER", "CONTRIBUTOR", "RETAILER", "ADMIN", name="userrole"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("ACTIVE", "BANNED", "PENDING", name="userstatus"),
+            nullable=False,
+        ),
+        sa.Column("warning_count", sa.Integer(), nullable=True),
+        sa.Column("region_id", sa.Integer(), nullable=True),
+        sa.Column("township_id", sa.Integer(), nullable=True),
+        sa.Column("image_url", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"]),
+        sa.ForeignKeyConstraint(["township_id"], ["townships.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_full_name"), "users", ["full_name"], unique=False)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+
+    op.create_table(
+        "shops",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("shop_name", sa.String(), nullable=False),
+        sa.Column("address_text", sa.String(), nullable=True),
+        sa.Column("operating_hours", sa.String(), nullable=True),
+        sa.Column("phone_number", sa.String(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("VERIFIED", "UNVERIFIED", name="shopstatus"),
+            nullable=False,
+        ),
+        sa.Column("owner_user_id", sa.Integer(), nullable=True),
+        sa.Column("region_id", sa.Integer(), nullable=True),
+        sa.Column("township_id", sa.Integer(), nullable=True),
+        sa.Column("image_url", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["owner_user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"]),
+        sa.ForeignKeyConstraint(["township_id"], ["townships.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_shops_id"), "shops", ["id"], unique=False)
+    op.create_index(op.f("ix_shops_shop_name"), "shops", ["shop_name"], unique=False)
+
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column(
+            "category",
+            sa.Enum("PRICE", "WATCHLIST", "SOCIAL", "SYSTEM", name="notificationcategory"),
+            nullable=False,
+        ),
+        sa.Column("read", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "fav_watch",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("shop_id", sa.Integer(), nullable=True),
+        sa.Column("item_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.ForeignKeyConstraint(["item_id"], ["items.id"]),
+        sa.ForeignKeyConstraint(["shop_id"], ["shops.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade():
+    op.drop_table("fav_watch")
+    op.drop_table("notifications")
+    op.drop_index(op.f("ix_shops_shop_name"), table_name="shops")
+    op.drop_index(op.f("ix_shops_id"), table_name="shops")
+    op.drop_table("shops")
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_users_full_name"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
+    op.drop_index(op.f("ix_items_name"), table_name="items")
+    op.drop_index(op.f("ix_items_id"), table_name="items")
+    op.drop_table("items")
+    op.drop_table("townships")
+    op.drop_index(op.f("ix_categories_name"), table_name="categories")
+    op.drop_index(op.f("ix_categories_id"), table_name="categories")
+    op.drop_table("categories")
+    op.drop_table("regions")
+
+    sa.Enum(name="notificationcategory").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="shopstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="userstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="userrole").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,29 @@
+"""notifications (user_id, created_at DESC) index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_notifications_user_created",
+        "notifications",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_notifications_user_created", table_name="notifications")
@@ -0,0 +1,29 @@
+"""notifications (category, created_at DESC) index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_notifications_category_created",
+        "notifications",
+        ["category", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_notifications_category_created", table_name="notifications")
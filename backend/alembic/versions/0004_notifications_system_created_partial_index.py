@@ -0,0 +1,30 @@
+"""notifications (created_at DESC) partial index for SYSTEM notifications
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_notifications_system_created",
+        "notifications",
+        [sa.text("created_at DESC")],
+        unique=False,
+        postgresql_where=sa.text("category = 'SYSTEM'"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_notifications_system_created", table_name="notifications")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -18,7 +19,7 @@ def create_item(item: ItemCreate, db: Session = Depends(get_postgres_db)):
     db.add(new_item)
     db.commit()
     db.refresh(new_item)
-    return new_item
+    return ORJSONResponse(content=ItemInDB.dump_trusted(new_item))
 
 @router.get("/", response_model=List[ItemInDB])
 def read_items(
@@ -31,14 +32,14 @@ def read_items(
     if category_id is not None:
         query = query.filter(models.Item.category_id == category_id)
     items = query.offset(skip).limit(limit).all()
-    return items
+    return ORJSONResponse(content=[ItemInDB.dump_trusted(item) for item in items])
 
 @router.get("/{item_id}", response_model=ItemInDB)
 def read_item(item_id: int, db: Session = Depends(get_postgres_db)):
     item = db.query(models.Item).filter(models.Item.id == item_id).first()
     if item is None:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return ORJSONResponse(content=ItemInDB.dump_trusted(item))
 
 @router.put("/{item_id}", response_model=ItemInDB)
 def update_item(item_id: int, item_update: ItemUpdate, db: Session = Depends(get_postgres_db)):
@@ -64,7 +65,7 @@ def update_item(item_id: int, item_update: ItemUpdate, db: Session = Depends(get
     
     db.commit()
     db.refresh(db_item)
-    return db_item
+    return ORJSONResponse(content=ItemInDB.dump_trusted(db_item))
 
 @router.delete("/{item_id}")
 def delete_item(item_id: int, db: Session = Depends(get_postgres_db)):
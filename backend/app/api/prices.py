@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from app.db.database import get_mongo_collection, get_postgres_db
-from app.schemas.price_entry import PriceEntryBase, PriceEntryInDB
+from app.schemas.price_entry import PriceEntryBase, PriceEntryInDB, PriceEntryRead
 from app.db import postgres_models as models
 from app.core.security import get_current_user
 from app.schemas.user import UserInDB
 from bson import ObjectId
 import logging
+import msgspec
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,6 +32,11 @@ def convert_mongo_doc_to_json(doc: dict) -> dict:
     
     return doc
 
+def price_entries_response(entries: List[dict]) -> Response:
+    """Encode JSON-ready price entry documents via the msgspec read mirror"""
+    structs = msgspec.convert(entries, List[PriceEntryRead])
+    return Response(content=msgspec.json.encode(structs), media_type="application/json")
+
 async def create_price_alerts_for_favorites(db: Session, shop_id: int, item_id: int, price: float, price_type: str, shop_name: str = None):
     """Create price alert notifications for users who have favorited this shop"""
     try:
@@ -291,7 +297,7 @@ async def read_shop_price_entries(
                 entry['shop_name'] = shop.shop_name
         
         logger.info(f"✅ Found {len(entries)} price entries for shop {shop_id}")
-        return [PriceEntryInDB.from_mongo(entry) for entry in entries]
+        return price_entries_response(entries)
         
     except Exception as e:
         logger.error(f"❌ Error reading shop price entries: {e}")
@@ -320,7 +326,7 @@ async def read_contributor_price_entries(
                 if ts.tzinfo is None:
                     ts = ts.replace(tzinfo=timezone.utc)
                 entry["timestamp"] = ts.astimezone(ZoneInfo("Asia/Yangon"))
-        return [PriceEntryInDB.from_mongo(entry) for entry in entries]
+        return price_entries_response(entries)
     except Exception as e:
         logger.error(f"❌ Error reading contributor price entries: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to read contributor price entries: {str(e)}")
@@ -443,9 +449,8 @@ async def read_price_entries(
         sample_items = entries[:3]  # Show first 3 entries
         logger.info(f"📊 Sample entries: {[{'itemId': e.get('itemId'), 'shop_name': e.get('shop_name', 'N/A')} for e in sample_items]}")
     
-    result = [PriceEntryInDB.from_mongo(entry) for entry in entries]
-    logger.info(f"✅ Returning {len(result)} price entries to frontend")
-    return result
+    logger.info(f"✅ Returning {len(entries)} price entries to frontend")
+    return price_entries_response(entries)
 
 @router.put("/{price_entry_id}", response_model=PriceEntryInDB)
 async def update_price_entry(
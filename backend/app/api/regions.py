@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_postgres_db
 from app.db import postgres_models as models
@@ -12,8 +13,9 @@ def create_region(region: RegionCreate, db: Session = Depends(get_postgres_db)):
     db.add(db_region)
     db.commit()
     db.refresh(db_region)
-    return db_region
+    return ORJSONResponse(content=RegionInDB.dump_trusted(db_region))
 
 @router.get("/", response_model=list[RegionInDB])
 def read_regions(db: Session = Depends(get_postgres_db)):
-    return db.query(models.Region).all()
+    regions = db.query(models.Region).all()
+    return ORJSONResponse(content=[RegionInDB.dump_trusted(region) for region in regions])
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from bson import ObjectId
 from datetime import datetime, timezone
@@ -11,6 +12,31 @@ from app.schemas.report import ReportBase, ReportInDB
 
 router = APIRouter()
 
+def reports_response(reports: List[dict]) -> ORJSONResponse:
+    """Serialize report documents (already shaped like ReportInDB) straight to JSON with orjson"""
+    for report in reports:
+        report["_id"] = str(report["_id"])
+        # Also set id field for frontend compatibility
+        report["id"] = report["_id"]
+        report.setdefault("warning_info", None)
+    return ORJSONResponse(content=reports)
+
+def price_entry_join_stages() -> List[dict]:
+    """Pipeline stages attaching each report's price entry as a single priceEntry field.
+
+    $unwind must directly follow $lookup: the server then folds it into the lookup
+    stage and never builds the priceEntry array, so no stage may go between them.
+    """
+    return [
+        {"$lookup": {
+            "from": "price_entries",
+            "localField": "priceEntryId",
+            "foreignField": "_id",
+            "as": "priceEntry"
+        }},
+        {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
+    ]
+
 @router.get("/test")
 async def test_reports_endpoint():
     """Test endpoint to verify reports API is working"""
@@ -127,16 +153,7 @@ async def read_reports(
         query["status"] = status.upper()
     
     # Simple MongoDB aggregation to join with price entries only
-    pipeline = [
-        {"$match": query},
-        {"$lookup": {
-            "from": "price_entries",
-            "localField": "priceEntryId",
-            "foreignField": "_id",
-            "as": "priceEntry"
-        }},
-        {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
-    ]
+    pipeline = [{"$match": query}, *price_entry_join_stages()]
     
     # Add price type filter after lookup if specified
     if priceType:
@@ -184,9 +201,9 @@ async def read_reports(
             "submitterRole": report.get("submitterRole"),
             "location": report.get("location")
         }
-        result.append(ReportInDB.from_mongo(report_dict))
+        result.append(report_dict)
     
-    return result
+    return reports_response(result)
 
 @router.get("/queue/pending", response_model=List[ReportInDB])
 async def get_pending_reports(
@@ -217,16 +234,7 @@ async def get_pending_reports(
     print(f"DEBUG: get_pending_reports - Query: {query}")
     
     # Simple MongoDB aggregation to join with price entries only
-    pipeline = [
-        {"$match": query},
-        {"$lookup": {
-            "from": "price_entries",
-            "localField": "priceEntryId",
-            "foreignField": "_id",
-            "as": "priceEntry"
-        }},
-        {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
-    ]
+    pipeline = [{"$match": query}, *price_entry_join_stages()]
     
     # Add price type filter after lookup if specified
     if priceType:
@@ -272,9 +280,9 @@ async def get_pending_reports(
             "submitterRole": report.get("submitterRole"),
             "location": report.get("location")
         }
-        result.append(ReportInDB.from_mongo(report_dict))
+        result.append(report_dict)
     
-    return result
+    return reports_response(result)
 
 @router.get("/history/reviewed", response_model=List[ReportInDB])
 async def get_reviewed_reports(
@@ -302,16 +310,7 @@ async def get_reviewed_reports(
         query["reasonForFlag"] = mapped_reason
     
     # Simple MongoDB aggregation to join with price entries only
-    pipeline = [
-        {"$match": query},
-        {"$lookup": {
-            "from": "price_entries",
-            "localField": "priceEntryId",
-            "foreignField": "_id",
-            "as": "priceEntry"
-        }},
-        {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
-    ]
+    pipeline = [{"$match": query}, *price_entry_join_stages()]
     
     # Add price type filter after lookup if specified
     if priceType:
@@ -357,9 +356,9 @@ async def get_reviewed_reports(
             "submitterRole": report.get("submitterRole"),
             "location": report.get("location")
         }
-        result.append(ReportInDB.from_mongo(report_dict))
+        result.append(report_dict)
     
-    return result
+    return reports_response(result)
 
 @router.put("/{report_id}", response_model=ReportInDB)
 async def update_report_status(report_id: str, status_update: dict, db: Session = Depends(get_postgres_db)):
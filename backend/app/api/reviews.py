@@ -3,7 +3,7 @@ from typing import List
 
 from app.db.database import get_mongo_collection
 from app.schemas.review import ReviewBase, ReviewInDB
-from app.services.sentiment_analysis import SentimentAnalyzer
+from app.services.sentiment_analysis import get_sentiment_analyzer
 from sqlalchemy.orm import Session
 from app.db.database import get_postgres_db
 from app.db import postgres_models as models
@@ -33,8 +33,7 @@ async def create_review(review: ReviewBase, db: Session = Depends(get_postgres_d
     
     # Analyze sentiment if comment exists
     if review.comment:
-        # Initialize sentiment analyzer
-        analyzer = SentimentAnalyzer()
+        analyzer = get_sentiment_analyzer()
         
         # Get sentiment analysis results
         sentiment_results = analyzer.analyze_sentiment(review.comment)
@@ -54,7 +53,7 @@ async def read_reviews(skip: int = 0, limit: int = 100):
     reviews = await collection.find().skip(skip).limit(limit).to_list(length=limit)
     
     # Process reviews to add sentiment analysis if missing
-    analyzer = SentimentAnalyzer()
+    analyzer = get_sentiment_analyzer()
     processed_reviews = []
     
     for review in reviews:
@@ -87,7 +86,7 @@ async def read_shop_reviews(shop_id: int, skip: int = 0, limit: int = 100):
     reviews = await collection.find({"shopId": shop_id}).skip(skip).limit(limit).to_list(length=limit)
     
     # Process reviews to add sentiment analysis if missing
-    analyzer = SentimentAnalyzer()
+    analyzer = get_sentiment_analyzer()
     processed_reviews = []
     
     for review in reviews:
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_postgres_db
 from app.schemas.shop import ShopCreate, ShopInDB, ShopResponse, ShopUpdate
@@ -48,7 +49,7 @@ def create_shop(
         db.add(db_shop)
         db.commit()
         db.refresh(db_shop)
-        return db_shop
+        return ORJSONResponse(content=ShopResponse.dump_trusted(db_shop))
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -63,19 +64,19 @@ def read_shops(
     db: Session = Depends(get_postgres_db)
 ):
     shops = db.query(models.Shop).offset(skip).limit(limit).all()
-    return shops
+    return ORJSONResponse(content=[ShopResponse.dump_trusted(shop) for shop in shops])
 
 @router.get("/owner/{owner_user_id}", response_model=list[ShopResponse])
 def read_shops_by_owner(owner_user_id: int, db: Session = Depends(get_postgres_db)):
     shops = db.query(models.Shop).filter(models.Shop.owner_user_id == owner_user_id).all()
-    return shops
+    return ORJSONResponse(content=[ShopResponse.dump_trusted(shop) for shop in shops])
 
 @router.get("/{shop_id}", response_model=ShopResponse)
 def read_shop(shop_id: int, db: Session = Depends(get_postgres_db)):
     shop = db.query(models.Shop).filter(models.Shop.id == shop_id).first()
     if not shop:
         raise HTTPException(status_code=404, detail="Shop not found")
-    return shop
+    return ORJSONResponse(content=ShopResponse.dump_trusted(shop))
 
 @router.put("/{shop_id}", response_model=ShopResponse)
 def update_shop(
@@ -118,7 +119,7 @@ def update_shop(
         db.add(db_shop)
         db.commit()
         db.refresh(db_shop)
-        return db_shop
+        return ORJSONResponse(content=ShopResponse.dump_trusted(db_shop))
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_postgres_db
 from app.db import postgres_models as models
@@ -22,11 +23,12 @@ def create_township(township: TownshipCreate, db: Session = Depends(get_postgres
     db.add(db_township)
     db.commit()
     db.refresh(db_township)
-    return db_township
+    return ORJSONResponse(content=TownshipInDB.dump_trusted(db_township))
 
 @router.get("/", response_model=list[TownshipInDB])
 def read_townships(region_id: int = None, db: Session = Depends(get_postgres_db)):
     query = db.query(models.Township)
     if region_id:
         query = query.filter(models.Township.region_id == region_id)
-    return query.all()
\ No newline at end of file
+    townships = query.all()
+    return ORJSONResponse(content=[TownshipInDB.dump_trusted(township) for township in townships])
\ No newline at end of file
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from typing import List, Optional
+import logging
 
 from app.db.database import get_postgres_db
 from app.db import postgres_models as models
@@ -17,12 +20,13 @@ from app.core import security
 from app.core.security import get_current_user, get_current_admin_user, get_password_hash, verify_password
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 @router.post("/register", response_model=UserResponse)
 def register_user(user: UserCreate, db: Session = Depends(get_postgres_db)):
     # Check if user already exists
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user:
+    email_taken = db.query(exists().where(models.User.email == user.email)).scalar()
+    if email_taken:
         raise HTTPException(
             status_code=400, 
             detail="Email already registered"
@@ -47,7 +51,7 @@ def register_user(user: UserCreate, db: Session = Depends(get_postgres_db)):
         db.add(db_user)
         db.commit()
         db.refresh(db_user)
-        return db_user
+        return ORJSONResponse(content=UserResponse.dump_trusted(db_user))
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -61,8 +65,10 @@ def register_retailer(
     db: Session = Depends(get_postgres_db)
 ):
     # Check if user already exists
-    db_user = db.query(models.User).filter(models.User.email == registration_data.user.email).first()
-    if db_user:
+    email_taken = db.query(
+        exists().where(models.User.email == registration_data.user.email)
+    ).scalar()
+    if email_taken:
         raise HTTPException(
             status_code=400, 
             detail="Email already registered"
@@ -111,12 +117,14 @@ def register_retailer(
         db.refresh(db_user)
         db.refresh(db_shop)
         
-        # Build structured response using schemas so Pydantic can serialize properly
-        return {
-            "user": db_user,
-            "shop": db_shop,
-            "message": "Retailer registered successfully",
-        }
+        # Both rows were just written and refreshed from the database, so the
+        # wrapper and its nested schemas are built without re-validation
+        response = RetailerRegistrationResponse.model_construct(
+            user=UserResponse.from_orm_trusted(db_user),
+            shop=ShopResponse.from_orm_trusted(db_shop),
+            message="Retailer registered successfully",
+        )
+        return ORJSONResponse(content=response.model_dump(mode="json"))
         
     except Exception as e:
         db.rollback()
@@ -134,7 +142,7 @@ def read_user(user_id: int, db: Session = Depends(get_postgres_db)):
     user = db.query(models.User).filter(models.User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return ORJSONResponse(content=UserResponse.dump_trusted(user))
 
 @router.get("/", response_model=List[UserResponse])
 def list_users(
@@ -190,14 +198,19 @@ def list_users(
     # Apply pagination
     users = query.offset(skip).limit(limit).all()
     
-    # Filter out admin users from the results
-    non_admin_users = [user for user in users if user.role != models.UserRole.ADMIN]
+    # Filter out admin users from the results. Rows come straight from the
+    # database, so build the response without re-running Pydantic validation.
+    non_admin_users = [
+        UserResponse.dump_trusted(user)
+        for user in users
+        if user.role != models.UserRole.ADMIN
+    ]
     
-    return non_admin_users
+    return ORJSONResponse(content=non_admin_users)
 
 @router.get("/me", response_model=UserResponse)
 def read_users_me(current_user: models.User = Depends(get_current_user)):
-    return current_user
+    return ORJSONResponse(content=UserResponse.dump_trusted(current_user))
 
 # Update current authenticated user
 @router.put("/me", response_model=UserResponse)
@@ -226,7 +239,7 @@ def update_current_user(
         db.add(current_user)
         db.commit()
         db.refresh(current_user)
-        return current_user
+        return ORJSONResponse(content=UserResponse.dump_trusted(current_user))
     except Exception:
         db.rollback()
         raise HTTPException(
@@ -252,16 +265,18 @@ def change_password(
         # Validate required fields
         if not password_data.get("current_password") or not password_data.get("new_password"):
             raise HTTPException(status_code=400, detail="Current password and new password are required")
-        
-        # Verify current password for the authenticated user
-        if not verify_password(password_data["current_password"], current_user.hashed_password):
-            raise HTTPException(status_code=400, detail="Current password is incorrect")
-        
-        # Validate new password strength
+
+        # Validate new password strength before paying for any bcrypt work
         new_password = password_data["new_password"]
         if len(new_password) < 6:
             raise HTTPException(status_code=400, detail="New password must be at least 6 characters long")
-        
+        if new_password == password_data["current_password"]:
+            raise HTTPException(status_code=400, detail="New password must be different from the current password")
+
+        # Verify current password for the authenticated user
+        if not verify_password(password_data["current_password"], current_user.hashed_password):
+            raise HTTPException(status_code=400, detail="Current password is incorrect")
+
         # Hash the new password
         new_hashed_password = get_password_hash(new_password)
         
@@ -294,40 +309,28 @@ def delete_user(user_id: int, db: Session = Depends(get_postgres_db)):
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        print(f"Attempting to delete user: {user.full_name} (ID: {user.id}, Role: {user.role})")
+        logger.debug("Attempting to delete user: %s (ID: %s, Role: %s)", user.full_name, user.id, user.role)
         
         # Prevent deletion of admin users (optional security measure)
         if user.role == models.UserRole.ADMIN:
             raise HTTPException(status_code=403, detail="Cannot delete admin users")
         
-        # Check for foreign key constraints and delete related data first
-        print(f"Checking for related data before deletion...")
+        # Delete related data first; bulk delete returns the row count, so no separate COUNT is needed
+        notifications_deleted = db.query(models.Notification).filter(models.Notification.user_id == user_id).delete()
+        logger.debug("Deleted %d notifications for user %s", notifications_deleted, user_id)
         
-        # Delete related notifications
-        notifications_count = db.query(models.Notification).filter(models.Notification.user_id == user_id).count()
-        if notifications_count > 0:
-            print(f"Deleting {notifications_count} notifications for user {user_id}")
-            db.query(models.Notification).filter(models.Notification.user_id == user_id).delete()
-        
-        # Delete related favorite/watch entries
-        fav_watch_count = db.query(models.FavWatch).filter(models.FavWatch.user_id == user_id).count()
-        if fav_watch_count > 0:
-            print(f"Deleting {fav_watch_count} favorite/watch entries for user {user_id}")
-            db.query(models.FavWatch).filter(models.FavWatch.user_id == user_id).delete()
+        fav_watch_deleted = db.query(models.FavWatch).filter(models.FavWatch.user_id == user_id).delete()
+        logger.debug("Deleted %d favorite/watch entries for user %s", fav_watch_deleted, user_id)
         
         # Delete related shops (if user is a retailer)
         # Note: Shop has cascade="all, delete-orphan" in the model, but let's be explicit
-        shop_count = db.query(models.Shop).filter(models.Shop.owner_user_id == user_id).count()
-        if shop_count > 0:
-            print(f"Deleting {shop_count} shops for user {user_id}")
-            db.query(models.Shop).filter(models.Shop.owner_user_id == user_id).delete()
-        
-        print(f"All related data deleted. Now deleting user...")
+        shops_deleted = db.query(models.Shop).filter(models.Shop.owner_user_id == user_id).delete()
+        logger.debug("Deleted %d shops for user %s", shops_deleted, user_id)
         
         # Delete the user
         db.delete(user)
         db.commit()
-        print(f"Successfully deleted user: {user.full_name}")
+        logger.debug("Successfully deleted user: %s", user.full_name)
         return {"message": "User deleted successfully"}
         
     except HTTPException:
@@ -335,9 +338,7 @@ def delete_user(user_id: int, db: Session = Depends(get_postgres_db)):
         raise
     except Exception as e:
         db.rollback()
-        print(f"Error deleting user {user_id}: {e}")
-        print(f"Error type: {type(e)}")
-        print(f"Error details: {str(e)}")
+        logger.error("Error deleting user %s: %s: %s", user_id, type(e).__name__, e)
         
         # Check for specific database constraint errors
         if "foreign key constraint" in str(e).lower():
@@ -2,6 +2,9 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Price Tracker API"
+    ENVIRONMENT: str = "development"
+    # Seed scripts set this to hash throwaway dev passwords at minimal bcrypt cost
+    SEED_MODE: bool = False
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_SERVER: str = "postgres-db"
@@ -17,6 +20,8 @@ class Settings(BaseSettings):
     MONGO_SERVER: str
     MONGO_PORT: str
     MONGO_DB_NAME: str
+    # Build Mongo-backed schemas without re-validation; set to false in dev to catch bad documents
+    TRUST_MONGO_DOCUMENTS: bool = True
 
     @property
     def MONGO_DATABASE_URI(self) -> str:
@@ -11,7 +11,15 @@ from app.core.config import settings
 from app.db import database, postgres_models
 from app.schemas import token as token_schema
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if settings.SEED_MODE and settings.ENVIRONMENT == "production":
+    raise RuntimeError("SEED_MODE cannot be enabled when ENVIRONMENT=production")
+
+# Seed data is disposable, so SEED_MODE drops bcrypt to its minimum cost factor
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    **({"bcrypt__rounds": 4} if settings.SEED_MODE else {}),
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
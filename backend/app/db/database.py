@@ -1,5 +1,11 @@
+import csv
+import enum
+import io
+from typing import Any, Iterable, Optional, Sequence
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
 import logging
@@ -8,8 +14,24 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-engine = create_engine(settings.POSTGRES_DATABASE_URI, pool_pre_ping=True)
+# Multi-row INSERTs go out as large VALUES pages; executemany UPDATE/DELETE use psycopg2's execute_batch.
+# The QueuePool keeps up to pool_size connections open for reuse within a process and
+# recycles them before server/proxy idle timeouts can drop them.
+engine = create_engine(
+    settings.POSTGRES_DATABASE_URI,
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Seed/maintenance scripts (seed_test_users, seed_admin_users, seed_reports, fix_notifications,
+# reset_password) keep attributes loaded across commit so post-commit prints don't re-SELECT
+SeedSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 # MongoDB connection with proper authentication
 mongo_client = None
@@ -62,6 +84,57 @@ def get_postgres_db():
     finally:
         db.close()
 
+def bulk_copy(session: Session, table_name: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Stream rows into a table with PostgreSQL COPY ... FROM STDIN instead of INSERT.
+
+    Meant for large seed batches. COPY bypasses SQLAlchemy type processing, so enum
+    members are written by name (as SAEnum stores them) and None becomes NULL; other
+    values must already be in a form Postgres can parse. Runs on the session's
+    connection, so it commits or rolls back with the session. Returns the row count.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    row_count = 0
+    for row in rows:
+        writer.writerow([
+            "\\N" if value is None else value.name if isinstance(value, enum.Enum) else value
+            for value in row
+        ])
+        row_count += 1
+    buffer.seek(0)
+    
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+    return row_count
+
+def insert_missing(session: Session, model, rows: Sequence[dict]) -> None:
+    """Insert rows in one INSERT ... ON CONFLICT DO NOTHING, skipping any that hit an existing key.
+
+    Replaces merge()-style SELECT-then-INSERT for static seed/test rows; existing rows
+    are left as they are rather than overwritten.
+    """
+    session.execute(pg_insert(model).values(rows).on_conflict_do_nothing())
+
+async def bulk_insert(collection, documents: Sequence[dict], batch_size: int = 1000, comment: Optional[str] = None) -> int:
+    """Insert documents in unordered insert_many batches of at most batch_size.
+
+    Bounds the size of each request for large seeds; comment tags the operations
+    so they can be picked out in the profiler / currentOp. Returns the inserted count.
+    """
+    inserted = 0
+    for start in range(0, len(documents), batch_size):
+        result = await collection.insert_many(
+            documents[start:start + batch_size], ordered=False, comment=comment
+        )
+        inserted += len(result.inserted_ids)
+    return inserted
+
 def get_mongo_collection(collection_name: str):
     global mongo_db
     if mongo_db is None:
@@ -80,6 +153,17 @@ def get_mongo_collection(collection_name: str):
     logger.info(f"📁 Using MongoDB collection: {collection_name}")
     return collection
 
+# Serves the moderation queue: reports filtered by status, newest first
+REPORTS_STATUS_TIMESTAMP_INDEX = [("status", 1), ("timestamp", -1)]
+
+async def ensure_mongo_indexes():
+    """Create the MongoDB indexes the API relies on; a no-op for ones that already exist.
+
+    Run from setup_database.py (MongoDB's counterpart to the Alembic migrations) and
+    by scripts that hint these indexes.
+    """
+    await get_mongo_collection("reports").create_index(REPORTS_STATUS_TIMESTAMP_INDEX)
+
 # Test MongoDB connection
 async def test_mongodb_connection():
     try:
@@ -8,6 +8,7 @@ from sqlalchemy import (
     ForeignKey,
     DateTime,
     Boolean,
+    Index,
 )
 from sqlalchemy.sql import func
 from sqlalchemy import text
@@ -117,6 +118,19 @@ class Notification(Base):
     read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, server_default=text('now()'))
 
+    # Serve per-user fan-out lookups and newest-first listings, and newest-first
+    # listings within a category; SYSTEM rows are few, so the latest announcements
+    # also get a small partial index of their own
+    __table_args__ = (
+        Index("ix_notifications_user_created", user_id, created_at.desc()),
+        Index("ix_notifications_category_created", category, created_at.desc()),
+        Index(
+            "ix_notifications_system_created",
+            created_at.desc(),
+            postgresql_where=text("category = 'SYSTEM'"),
+        ),
+    )
+
 
 class FavWatch(Base):
     __tablename__ = "fav_watch"
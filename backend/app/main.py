@@ -7,12 +7,11 @@ from app.api import router as api_router
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api import auth, users, shops, items, prices, reports, reviews
-from app.db.postgres_models import Base
-from app.db.database import engine, get_postgres_db
+from app.db.database import get_postgres_db
 from sqlalchemy.orm import Session
 
-# Database tables တွေကို create လုပ်ဖို့
-Base.metadata.create_all(bind=engine)
+# Database tables are created by Alembic migrations (`alembic upgrade head`),
+# run once per deploy rather than on every worker start.
 
 def seed_database():
     """Seed the database with initial data"""
@@ -22,82 +21,66 @@ def seed_database():
     db = next(get_postgres_db())
     
     try:
-        # Check if regions already exist
-        existing_regions = db.query(models.Region).count()
+        # Seed everything in one transaction; flushes assign the IDs later rows reference
+        with db.begin():
+            # Check if regions already exist
+            existing_regions = db.query(models.Region).count()
+            if existing_regions == 0:
+                # Create sample regions
+                regions = [
+                    models.Region(name="Yangon"),
+                    models.Region(name="Mandalay"),
+                    models.Region(name="Nay Pyi Taw"),
+                    models.Region(name="Bago"),
+                    models.Region(name="Mawlamyine"),
+                ]
+                db.add_all(regions)
+                db.flush()
+                
+                yangon, mandalay, naypyitaw = regions[0], regions[1], regions[2]
+                
+                # Create sample townships
+                townships = [
+                    models.Township(name="Hlaing", region_id=yangon.id, latitude=16.8661, longitude=96.1951),
+                    models.Township(name="Kamayut", region_id=yangon.id, latitude=16.8000, longitude=96.1500),
+                    models.Township(name="Sanchaung", region_id=yangon.id, latitude=16.7833, longitude=96.1333),
+                    models.Township(name="Chan Aye Tharzan", region_id=mandalay.id, latitude=21.9588, longitude=96.0891),
+                    models.Township(name="Amarapura", region_id=mandalay.id, latitude=21.9000, longitude=96.0500),
+                    models.Township(name="Pyinmana", region_id=naypyitaw.id, latitude=19.7500, longitude=96.2167),
+                    models.Township(name="Lewe", region_id=naypyitaw.id, latitude=19.6833, longitude=96.2167),
+                ]
+                db.add_all(townships)
+                
+                # Create sample categories
+                categories = [
+                    models.Category(name="Oils & Spices"),
+                    models.Category(name="Grains & Cereals"),
+                    models.Category(name="Vegetables & Fruits"),
+                    models.Category(name="Meat & Fish"),
+                    models.Category(name="Dairy & Eggs"),
+                    models.Category(name="Beverages"),
+                ]
+                db.add_all(categories)
+                db.flush()
+                
+                oils_category, grains_category, vegetables_category = categories[0], categories[1], categories[2]
+                
+                # Create sample items
+                items = [
+                    models.Item(name="Peanut Oil", default_unit="liter", category_id=oils_category.id),
+                    models.Item(name="Cooking Oil", default_unit="liter", category_id=oils_category.id),
+                    models.Item(name="Rice", default_unit="kg", category_id=grains_category.id),
+                    models.Item(name="Beans", default_unit="kg", category_id=grains_category.id),
+                    models.Item(name="Tomatoes", default_unit="kg", category_id=vegetables_category.id),
+                    models.Item(name="Onions", default_unit="kg", category_id=vegetables_category.id),
+                    models.Item(name="Potatoes", default_unit="kg", category_id=vegetables_category.id),
+                ]
+                db.add_all(items)
+        
         if existing_regions == 0:
-            # Create sample regions
-            regions = [
-                models.Region(name="Yangon"),
-                models.Region(name="Mandalay"),
-                models.Region(name="Nay Pyi Taw"),
-                models.Region(name="Bago"),
-                models.Region(name="Mawlamyine"),
-            ]
-            
-            for region in regions:
-                db.add(region)
-            
-            db.commit()
             print("✅ Regions seeded successfully")
-            
-            # Get the created regions to create townships
-            yangon = db.query(models.Region).filter(models.Region.name == "Yangon").first()
-            mandalay = db.query(models.Region).filter(models.Region.name == "Mandalay").first()
-            naypyitaw = db.query(models.Region).filter(models.Region.name == "Nay Pyi Taw").first()
-            
-            # Create sample townships
-            townships = [
-                models.Township(name="Hlaing", region_id=yangon.id, latitude=16.8661, longitude=96.1951),
-                models.Township(name="Kamayut", region_id=yangon.id, latitude=16.8000, longitude=96.1500),
-                models.Township(name="Sanchaung", region_id=yangon.id, latitude=16.7833, longitude=96.1333),
-                models.Township(name="Chan Aye Tharzan", region_id=mandalay.id, latitude=21.9588, longitude=96.0891),
-                models.Township(name="Amarapura", region_id=mandalay.id, latitude=21.9000, longitude=96.0500),
-                models.Township(name="Pyinmana", region_id=naypyitaw.id, latitude=19.7500, longitude=96.2167),
-                models.Township(name="Lewe", region_id=naypyitaw.id, latitude=19.6833, longitude=96.2167),
-            ]
-            
-            for township in townships:
-                db.add(township)
-            
-            db.commit()
             print("✅ Townships seeded successfully")
-            
-            # Create sample categories
-            categories = [
-                models.Category(name="Oils & Spices"),
-                models.Category(name="Grains & Cereals"),
-                models.Category(name="Vegetables & Fruits"),
-                models.Category(name="Meat & Fish"),
-                models.Category(name="Dairy & Eggs"),
-                models.Category(name="Beverages"),
-            ]
-            
-            for category in categories:
-                db.add(category)
-            
-            db.commit()
             print("✅ Categories seeded successfully")
-            
-            # Get the created categories to create items
-            oils_category = db.query(models.Category).filter(models.Category.name == "Oils & Spices").first()
-            grains_category = db.query(models.Category).filter(models.Category.name == "Grains & Cereals").first()
-            vegetables_category = db.query(models.Category).filter(models.Category.name == "Vegetables & Fruits").first()
-            
-            # Create sample items
-            items = [
-                models.Item(name="Peanut Oil", default_unit="liter", category_id=oils_category.id),
-                models.Item(name="Cooking Oil", default_unit="liter", category_id=oils_category.id),
-                models.Item(name="Rice", default_unit="kg", category_id=grains_category.id),
-                models.Item(name="Beans", default_unit="kg", category_id=grains_category.id),
-                models.Item(name="Tomatoes", default_unit="kg", category_id=vegetables_category.id),
-                models.Item(name="Onions", default_unit="kg", category_id=vegetables_category.id),
-                models.Item(name="Potatoes", default_unit="kg", category_id=vegetables_category.id),
-            ]
-            
-            for item in items:
-                db.add(item)
-            
-            db.commit()
             print("✅ Items seeded successfully")
             
     except Exception as e:
@@ -1,11 +1,57 @@
 from pydantic.json_schema import GetJsonSchemaHandler
 from pydantic_core import CoreSchema
 from bson import ObjectId
-from typing import Any
+from typing import Any, get_args
 
 from pydantic import BaseModel
 from typing import Optional
 
+class TrustedORMMixin:
+    """Build a schema from an ORM row without re-running Pydantic validation.
+
+    Columns coming back from PostgreSQL are already typed by the database, so
+    `model_construct` is enough. Nested schemas that also use this mixin are
+    constructed recursively.
+    """
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        data = {}
+        for name, field in cls.model_fields.items():
+            value = getattr(obj, name, field.get_default())
+            nested = field.annotation
+            if value is not None and isinstance(nested, type) and issubclass(nested, TrustedORMMixin):
+                value = nested.from_orm_trusted(value)
+            data[name] = value
+        return cls.model_construct(_fields_set=set(cls.model_fields), **data)
+
+    @classmethod
+    def dump_trusted(cls, obj) -> dict:
+        return cls.from_orm_trusted(obj).model_dump(mode="json")
+
+
+def _nested_model(annotation):
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+    return None
+
+
+def construct_trusted(model, data: dict):
+    """`model_construct` for documents we wrote ourselves, including nested sub-documents."""
+    values = dict(data)
+    for name, field in model.model_fields.items():
+        key = field.alias if field.alias in values else name
+        value = values.get(key)
+        if isinstance(value, dict):
+            nested = _nested_model(field.annotation)
+            if nested is not None:
+                values[key] = construct_trusted(nested, value)
+    return model.model_construct(**values)
+
+
 class PyObjectId(ObjectId):
     @classmethod
     def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetJsonSchemaHandler) -> CoreSchema:
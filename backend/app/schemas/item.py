@@ -1,7 +1,8 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from .base_schemas import TrustedORMMixin
 
-class CategoryInfo(BaseModel):
+class CategoryInfo(TrustedORMMixin, BaseModel):
     id: int
     name: str
     model_config = ConfigDict(from_attributes=True)
@@ -19,7 +20,7 @@ class ItemUpdate(BaseModel):
     default_unit: Optional[str] = None
     category_id: Optional[int] = None
 
-class ItemInDB(ItemBase):
+class ItemInDB(TrustedORMMixin, ItemBase):
     id: int
     category: CategoryInfo
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, revalidate_instances='never')
@@ -1,14 +1,25 @@
+import enum
 from pydantic import BaseModel, Field
 from pydantic import ConfigDict
 from typing import Literal, Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from bson import ObjectId
-from .base_schemas import PyObjectId
+from functools import partial
+import msgspec
+from .base_schemas import PyObjectId, construct_trusted
+from app.core.config import settings
+from app.db.postgres_models import UserRole
+
+_YANGON_TZ = ZoneInfo("Asia/Yangon")
+
+class PriceType(str, enum.Enum):
+    WHOLESALE = "WHOLESALE"
+    RETAIL = "RETAIL"
 
 class SubmittedBy(BaseModel):
     id: int
-    role: Literal["CONTRIBUTOR", "RETAILER", "USER", "ADMIN"]
+    role: UserRole
+    model_config = ConfigDict(use_enum_values=True)
 
 class LocationInfo(BaseModel):
     region_id: Optional[int] = None
@@ -16,14 +27,15 @@ class LocationInfo(BaseModel):
 
 class PriceEntryBase(BaseModel):
     itemId: int
-    type: Literal["WHOLESALE", "RETAIL"]
+    type: PriceType
     price: float
     unit: str
     # Optional to allow deriving from shop
     location: Optional[LocationInfo] = None
     submittedBy: Optional[SubmittedBy] = None
     shopId: Optional[int] = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(ZoneInfo("Asia/Yangon")))
+    timestamp: datetime = Field(default_factory=partial(datetime.now, _YANGON_TZ))
+    model_config = ConfigDict(use_enum_values=True)
 
 class PriceEntryInDB(PriceEntryBase):
     id: str = Field(alias="_id")
@@ -36,10 +48,36 @@ class PriceEntryInDB(PriceEntryBase):
     def from_mongo(cls, data: dict):
         if "_id" in data:
             data["_id"] = str(data["_id"])
-        return cls(**data)
+        if not settings.TRUST_MONGO_DOCUMENTS:
+            return cls.model_validate(data)
+        return construct_trusted(cls, data)
     
-    model_config = ConfigDict(
-        populate_by_name=True,
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
\ No newline at end of file
+    # Read-only once built from a document
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+
+# Read-path mirrors of PriceEntryInDB. Documents coming back from MongoDB were
+# validated on write, so list endpoints decode them straight into these structs
+# and encode with msgspec instead of building a Pydantic model per document.
+class SubmittedByRead(msgspec.Struct, gc=False):
+    id: int
+    role: Literal["CONTRIBUTOR", "RETAILER", "USER", "ADMIN"]
+
+class LocationInfoRead(msgspec.Struct, gc=False, kw_only=True):
+    region_id: Optional[int] = None
+    township_id: int
+
+class PriceEntryRead(msgspec.Struct, kw_only=True):
+    id: str = msgspec.field(name="_id")
+    itemId: int
+    type: Literal["WHOLESALE", "RETAIL"]
+    price: float
+    unit: str
+    location: Optional[LocationInfoRead] = None
+    submittedBy: Optional[SubmittedByRead] = None
+    shopId: Optional[int] = None
+    timestamp: datetime
+    region_name: Optional[str] = None
+    township_name: Optional[str] = None
+    coordinates: Optional[dict] = None
+    shop_name: Optional[str] = None
@@ -1,5 +1,6 @@
 # app/schemas/region.py
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from .base_schemas import TrustedORMMixin
 
 class RegionBase(BaseModel):
     name: str
@@ -7,8 +8,6 @@ class RegionBase(BaseModel):
 class RegionCreate(RegionBase):
     pass
 
-class RegionInDB(RegionBase):
+class RegionInDB(TrustedORMMixin, RegionBase):
     id: int
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,22 +1,38 @@
+import enum
 from pydantic import BaseModel, Field
 from pydantic import ConfigDict
-from typing import Literal, Optional
+from typing import Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from bson import ObjectId 
+from functools import partial
+from app.core.config import settings
+from .base_schemas import construct_trusted
+from .price_entry import PriceType
+
+_YANGON_TZ = ZoneInfo("Asia/Yangon")
+
+class ReportReason(str, enum.Enum):
+    AI_FLAG_PRICE_HIGH = "AI_FLAG_PRICE_HIGH"
+    USER_SUGGESTION = "USER_SUGGESTION"
+
+class ReportStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    REVIEWED = "REVIEWED"
+    DISMISSED = "DISMISSED"
 
 class ReportBase(BaseModel):
     priceEntryId: str  
     reportedByUserId: int
-    reasonForFlag: Literal["AI_FLAG_PRICE_HIGH", "USER_SUGGESTION"]
+    reasonForFlag: ReportReason
     details: str
-    status: Literal["PENDING", "REVIEWED", "DISMISSED"] = "PENDING"
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(ZoneInfo("Asia/Yangon")))
+    status: ReportStatus = ReportStatus.PENDING.value
+    timestamp: datetime = Field(default_factory=partial(datetime.now, _YANGON_TZ))
+    model_config = ConfigDict(use_enum_values=True)
 
 class ReportInDB(ReportBase):
     id: str = Field(alias="_id")
     # Additional enriched fields from price entry
-    priceType: Optional[Literal["WHOLESALE", "RETAIL"]] = None
+    priceType: Optional[PriceType] = None
     itemName: Optional[str] = None
     shopName: Optional[str] = None
     shopAddress: Optional[str] = None
@@ -35,12 +51,11 @@ class ReportInDB(ReportBase):
             # Also set id field for frontend compatibility
             data["id"] = str(data["_id"])
         # Ensure nested references are serialized to strings
-        if "priceEntryId" in data and isinstance(data["priceEntryId"], ObjectId):
-            data["priceEntryId"] = str(data["priceEntryId"]) 
-        return cls(**data)
+        # (str() of an already-stringified id is a no-op, so no type check is needed)
+        if (price_entry_id := data.get("priceEntryId")) is not None:
+            data["priceEntryId"] = str(price_entry_id)
+        if not settings.TRUST_MONGO_DOCUMENTS:
+            return cls.model_validate(data)
+        return construct_trusted(cls, data)
     
-    model_config = ConfigDict(
-        populate_by_name=True,
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}  
-    )
\ No newline at end of file
+    model_config = ConfigDict(populate_by_name=True)
\ No newline at end of file
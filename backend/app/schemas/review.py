@@ -2,15 +2,19 @@ from pydantic import BaseModel, Field
 from pydantic import ConfigDict
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from bson import ObjectId
+from functools import partial
 from typing import Optional, Dict, Any
+from app.core.config import settings
+from .base_schemas import construct_trusted
+
+_YANGON_TZ = ZoneInfo("Asia/Yangon")
 
 class ReviewBase(BaseModel):
     shopId: int
     userId: int
     rating: int = Field(ge=1, le=5)
     comment: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(ZoneInfo("Asia/Yangon")))
+    timestamp: datetime = Field(default_factory=partial(datetime.now, _YANGON_TZ))
     sentiment_score: Optional[float] = None
     sentiment_label: Optional[str] = None
     sentiment_details: Optional[Dict[str, Any]] = None
@@ -22,10 +26,8 @@ class ReviewInDB(ReviewBase):
     def from_mongo(cls, data: dict):
         if "_id" in data:
             data["_id"] = str(data["_id"])
-        return cls(**data)
+        if not settings.TRUST_MONGO_DOCUMENTS:
+            return cls.model_validate(data)
+        return construct_trusted(cls, data)
     
-    model_config = ConfigDict(
-        populate_by_name=True,
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str}
-    )
\ No newline at end of file
+    model_config = ConfigDict(populate_by_name=True)
\ No newline at end of file
@@ -2,6 +2,7 @@ from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from app.db.postgres_models import ShopStatus
+from .base_schemas import TrustedORMMixin
 
 class Location(BaseModel):
     latitude: float
@@ -36,16 +37,12 @@ class TownshipInfo(BaseModel):
     longitude: float
     model_config = ConfigDict(from_attributes=True)
 
-class ShopInDB(ShopBase):
+class ShopInDB(TrustedORMMixin, ShopBase):
     id: int
     status: ShopStatus
     owner_user_id: int
     created_at: datetime | None = None
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, revalidate_instances='never')
 
-class ShopResponse(ShopBase):
-    id: int
-    status: ShopStatus
-    owner_user_id: int
-    created_at: datetime | None = None
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+# Same shape as ShopInDB; alias it so only one core schema is built
+ShopResponse = ShopInDB
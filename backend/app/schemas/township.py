@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from .base_schemas import TrustedORMMixin
 
 class TownshipBase(BaseModel):
     name: str
@@ -10,6 +11,6 @@ class TownshipBase(BaseModel):
 class TownshipCreate(TownshipBase):
     pass
 
-class TownshipInDB(TownshipBase):
+class TownshipInDB(TrustedORMMixin, TownshipBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
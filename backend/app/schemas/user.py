@@ -3,6 +3,7 @@ from typing import Optional
 from datetime import datetime
 from app.db.postgres_models import UserRole, UserStatus
 from app.schemas.shop import ShopResponse
+from app.schemas.base_schemas import TrustedORMMixin
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -33,7 +34,7 @@ class UserUpdate(BaseModel):
     township_id: Optional[int] = None
     image_url: Optional[str] = None
 
-class UserInDB(UserBase):
+class UserInDB(TrustedORMMixin, UserBase):
     id: int
     role: UserRole
     status: UserStatus
@@ -43,21 +44,11 @@ class UserInDB(UserBase):
     township_id: Optional[int] = None
     image_url: Optional[str] = None
     created_at: datetime
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, revalidate_instances='never')
 
-class UserResponse(BaseModel):
-    id: int
-    email: EmailStr
-    full_name: Optional[str] = None
-    role: UserRole
-    status: UserStatus
-    warning_count: int
-    phone_number: Optional[str] = None
-    region_id: Optional[int] = None
-    township_id: Optional[int] = None
-    image_url: Optional[str] = None
-    created_at: datetime
-    model_config = ConfigDict(from_attributes=True)
+class UserResponse(UserInDB):
+    # Stored emails were validated at registration; skip email-validator on reads
+    email: str
 
 class RetailerRegistrationRequest(BaseModel):
     user: UserCreate
@@ -72,4 +63,4 @@ class RetailerRegistrationResponse(BaseModel):
     user: UserResponse
     shop: ShopResponse
     message: str
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, revalidate_instances='never')
\ No newline at end of file
@@ -1,38 +1,56 @@
 """
 Sentiment Analysis Service for Review Comments
 """
+import copy
 import logging
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer as NLTKSentimentAnalyzer
+from nltk.sentiment import SentimentIntensityAnalyzer as VaderAnalyzer
 
-# Download required NLTK data (run once)
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon', quiet=True)
+logger = logging.getLogger(__name__)
 
-try:
-    nltk.data.find('punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+# Comments shorter than this (or with fewer spaces) skip TextBlob entirely
+SHORT_TEXT_MAX_CHARS = 80
+SHORT_TEXT_MAX_SPACES = 10
 
-logger = logging.getLogger(__name__)
+# Weights for combining scores (VADER is often better for social media text)
+TEXTBLOB_WEIGHT = 0.4
+VADER_WEIGHT = 0.6
+COMBINED_THRESHOLD = 0.1
+
+POSITIVE = "positive"
+NEGATIVE = "negative"
+NEUTRAL = "neutral"
+
+# Results for short, frequently repeated comments ("good", "ok", ...) are cached
+CACHE_MAX_TEXT_LENGTH = 200
+CACHE_MAX_ENTRIES = 4096
+
+def _ensure_nltk_data():
+    """Download required NLTK data (run once, on first analyzer use)"""
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon', quiet=True)
+
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
 
 class SentimentAnalyzer:
     """Sentiment analysis service using multiple algorithms"""
     
-    def __init__(self):
-        self.vader_analyzer = SentimentIntensityAnalyzer()
-        try:
-            self.nltk_analyzer = NLTKSentimentAnalyzer()
-        except:
-            self.nltk_analyzer = None
-            logger.warning("NLTK Sentiment Analyzer not available")
+    def __init__(self) -> None:
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.vader_analyzer = VaderAnalyzer()
     
-    def analyze_sentiment(self, text: str) -> Dict[str, any]:
+    def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """
         Analyze sentiment of text using multiple methods
         Returns comprehensive sentiment analysis results
@@ -40,20 +58,83 @@ class SentimentAnalyzer:
         if not text or not text.strip():
             return self._get_neutral_sentiment()
         
+        # Key on the stripped text only: VADER scores capitalisation, so case is significant
+        key = text.strip()
+        if len(key) > CACHE_MAX_TEXT_LENGTH:
+            return self._analyze_uncached(text)
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is None:
+            cached = self._analyze_uncached(text)
+            with self._cache_lock:
+                self._cache[key] = cached
+                if len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)  # FIFO eviction
+        return copy.deepcopy(cached)
+    
+    def analyze_sentiments_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze many texts at once (bulk review ingestion)
+        Empty, cached and duplicate texts are resolved before any analyzer runs
+        """
+        results: List[Any] = [None] * len(texts)
+        pending: Dict[str, List[int]] = {}
+        
+        with self._cache_lock:
+            cache_get = self._cache.get
+            for index, text in enumerate(texts):
+                key = text.strip() if text else ""
+                if not key:
+                    results[index] = self._get_neutral_sentiment()
+                    continue
+                cached = cache_get(key) if len(key) <= CACHE_MAX_TEXT_LENGTH else None
+                if cached is not None:
+                    results[index] = copy.deepcopy(cached)
+                else:
+                    pending.setdefault(key, []).append(index)
+        
+        analyze = self._analyze_uncached
+        for key, indexes in pending.items():
+            analyzed = analyze(key)
+            if len(key) <= CACHE_MAX_TEXT_LENGTH:
+                with self._cache_lock:
+                    self._cache[key] = analyzed
+                    if len(self._cache) > CACHE_MAX_ENTRIES:
+                        self._cache.popitem(last=False)
+            for index in indexes:
+                results[index] = copy.deepcopy(analyzed)
+        
+        return results
+    
+    def _analyze_uncached(self, text: str) -> Dict[str, Any]:
+        """Run the analyzers without consulting the cache"""
         try:
-            # TextBlob Analysis
-            textblob_sentiment = self._analyze_with_textblob(text)
-            
             # VADER Analysis
             vader_sentiment = self._analyze_with_vader(text)
             
+            # Short comments: TextBlob is far slower than VADER and adds little, so use VADER alone
+            if len(text) < SHORT_TEXT_MAX_CHARS or text.count(' ') < SHORT_TEXT_MAX_SPACES:
+                return {
+                    "overall_sentiment": vader_sentiment["label"],
+                    "confidence": vader_sentiment["confidence"],
+                    "polarity_score": vader_sentiment["compound"],
+                    "details": {
+                        "textblob": {"label": "neutral", "polarity": 0.0, "subjectivity": 0.0, "confidence": 0.0},
+                        "vader": vader_sentiment
+                    }
+                }
+            
+            # TextBlob Analysis
+            textblob_sentiment = self._analyze_with_textblob(text)
+            
             # Combine results for final sentiment
-            combined_sentiment = self._combine_sentiments(textblob_sentiment, vader_sentiment)
+            label, polarity, confidence = self._combine_sentiments(textblob_sentiment, vader_sentiment)
             
             return {
-                "overall_sentiment": combined_sentiment["label"],
-                "confidence": combined_sentiment["confidence"],
-                "polarity_score": combined_sentiment["polarity"],
+                "overall_sentiment": label,
+                "confidence": confidence,
+                "polarity_score": polarity,
                 "details": {
                     "textblob": textblob_sentiment,
                     "vader": vader_sentiment
@@ -64,7 +145,7 @@ class SentimentAnalyzer:
             logger.error(f"Error analyzing sentiment: {e}")
             return self._get_neutral_sentiment()
     
-    def _analyze_with_textblob(self, text: str) -> Dict[str, any]:
+    def _analyze_with_textblob(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using TextBlob"""
         blob = TextBlob(text)
         polarity = blob.sentiment.polarity  # -1 to 1
@@ -85,7 +166,7 @@ class SentimentAnalyzer:
             "confidence": abs(polarity)
         }
     
-    def _analyze_with_vader(self, text: str) -> Dict[str, any]:
+    def _analyze_with_vader(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using VADER"""
         scores = self.vader_analyzer.polarity_scores(text)
         
@@ -107,37 +188,15 @@ class SentimentAnalyzer:
             "confidence": abs(compound)
         }
     
-    def _combine_sentiments(self, textblob_result: Dict, vader_result: Dict) -> Dict[str, any]:
-        """Combine TextBlob and VADER results for final sentiment"""
-        
-        # Weight the results (VADER is often better for social media text)
-        textblob_weight = 0.4
-        vader_weight = 0.6
-        
-        # Combine polarity scores
-        textblob_polarity = textblob_result["polarity"]
-        vader_polarity = vader_result["compound"]
-        
-        combined_polarity = (textblob_polarity * textblob_weight) + (vader_polarity * vader_weight)
-        
-        # Determine final sentiment label
-        if combined_polarity > 0.1:
-            final_label = "positive"
-        elif combined_polarity < -0.1:
-            final_label = "negative"
-        else:
-            final_label = "neutral"
-        
-        # Calculate confidence as average of individual confidences
-        combined_confidence = (textblob_result["confidence"] * textblob_weight) + (vader_result["confidence"] * vader_weight)
-        
-        return {
-            "label": final_label,
-            "polarity": combined_polarity,
-            "confidence": min(combined_confidence, 1.0)  # Cap at 1.0
-        }
+    def _combine_sentiments(self, textblob_result: Dict, vader_result: Dict) -> Tuple[str, float, float]:
+        """Combine TextBlob and VADER results into (label, polarity, confidence)"""
+        polarity = textblob_result["polarity"] * TEXTBLOB_WEIGHT + vader_result["compound"] * VADER_WEIGHT
+        label = POSITIVE if polarity > COMBINED_THRESHOLD else NEGATIVE if polarity < -COMBINED_THRESHOLD else NEUTRAL
+        # Confidence is the weighted average of the individual confidences, capped at 1.0
+        confidence = min(textblob_result["confidence"] * TEXTBLOB_WEIGHT + vader_result["confidence"] * VADER_WEIGHT, 1.0)
+        return label, polarity, confidence
     
-    def _get_neutral_sentiment(self) -> Dict[str, any]:
+    def _get_neutral_sentiment(self) -> Dict[str, Any]:
         """Return neutral sentiment for error cases or empty text"""
         return {
             "overall_sentiment": "neutral",
@@ -149,11 +208,23 @@ class SentimentAnalyzer:
             }
         }
 
-# Global instance
-sentiment_analyzer = SentimentAnalyzer()
+@lru_cache(maxsize=1)
+def get_sentiment_analyzer() -> SentimentAnalyzer:
+    """
+    Shared analyzer instance, built lazily so lexicons are only loaded
+    by workers that actually analyze reviews
+    """
+    _ensure_nltk_data()
+    return SentimentAnalyzer()
 
-def analyze_review_sentiment(comment: str) -> Dict[str, any]:
+def analyze_review_sentiment(comment: str) -> Dict[str, Any]:
     """
     Convenience function to analyze sentiment of a review comment
     """
-    return sentiment_analyzer.analyze_sentiment(comment)
+    return get_sentiment_analyzer().analyze_sentiment(comment)
+
+def analyze_review_sentiments(comments: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convenience function to analyze sentiment of many review comments
+    """
+    return get_sentiment_analyzer().analyze_sentiments_batch(comments)
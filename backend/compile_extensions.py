@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Optionally compile hot pure-Python modules with mypyc.
+
+The compiled .so is placed next to the .py source and is picked up by the
+normal import. If mypyc is not installed or compilation fails, the app keeps
+running the pure-Python module, so this step is never required.
+
+Usage (from the backend/ directory):
+    pip install -r requirements-dev.txt
+    python compile_extensions.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+# Pydantic schema modules are not listed: mypyc cannot compile BaseModel
+# subclasses (their metaclass-generated attributes fail to build), and their
+# validators already run inside pydantic-core.
+MODULES = [
+    "app/services/sentiment_analysis.py",
+]
+
+def main():
+    if shutil.which("mypyc") is None:
+        print("⚠️ mypyc not found; install requirements-dev.txt to compile extensions")
+        print("Continuing with pure-Python modules.")
+        return 0
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        ["mypyc", "--ignore-missing-imports", "--explicit-package-bases", *MODULES],
+        cwd=backend_dir,
+    )
+    if result.returncode != 0:
+        print("❌ mypyc compilation failed; the pure-Python modules will be used")
+        return result.returncode
+
+    print(f"✅ Compiled {len(MODULES)} module(s) with mypyc")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,11 @@
 Quick test of the broadcast API without authentication
 """
 
-import requests
+import asyncio
+import httpx
 import json
 
-def test_broadcast_api():
+async def test_broadcast_api(client: httpx.AsyncClient):
     """Test the broadcast API endpoint"""
     
     url = "http://localhost:8000/api/notifications/broadcast"
@@ -20,7 +21,7 @@ def test_broadcast_api():
     print(f"📋 Data: {json.dumps(test_data, indent=2)}")
     
     try:
-        response = requests.post(url, json=test_data, timeout=10)
+        response = await client.post(url, json=test_data)
         
         print(f"📨 Status: {response.status_code}")
         
@@ -38,7 +39,7 @@ def test_broadcast_api():
                 print(f"📄 Raw error: {response.text}")
             return False
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"❌ Cannot connect to server!")
         print(f"🔧 Start server: uvicorn app.main:app --reload --host 0.0.0.0 --port 8000")
         return False
@@ -46,7 +47,13 @@ def test_broadcast_api():
         print(f"❌ Error: {e}")
         return False
 
+async def main():
+    # One pooled client for every check, so connections (and TLS, when used) are reused;
+    # HTTP/2 is negotiated where the server supports it
+    async with httpx.AsyncClient(http2=True, timeout=10) as client:
+        await test_broadcast_api(client)
+
 if __name__ == "__main__":
     print("🚀 Quick API Test")
     print("=" * 30)
-    test_broadcast_api()
+    asyncio.run(main())
@@ -13,7 +13,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 # Load environment variables
 load_dotenv(dotenv_path='config.env')
 
-from app.db.database import get_postgres_db
+# Seed data only needs cheap password hashes
+os.environ["SEED_MODE"] = "1"
+
+from app.db.database import SeedSessionLocal
 from app.db import postgres_models as models
 from app.core.security import get_password_hash
 
@@ -23,7 +26,7 @@ def reset_password():
     print("🔧 Resetting Contributor Password to Known Value")
     print("=" * 50)
     
-    db = next(get_postgres_db())
+    db = SeedSessionLocal()
     
     try:
         # Look for contributor users first
@@ -14,7 +14,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 config_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(dotenv_path=config_path)
 
-from app.db.database import get_postgres_db
+# Seed data only needs cheap password hashes
+os.environ["SEED_MODE"] = "1"
+
+from app.db.database import SeedSessionLocal
 from app.db import postgres_models as models
 from app.core.security import get_password_hash
 
@@ -24,7 +27,7 @@ ADMIN_PASSWORD = "adminpassword"
 
 def seed_admin():
     """Seed the database with a new admin user"""
-    db = next(get_postgres_db())
+    db = SeedSessionLocal()
     
     try:
         # Check if admin user already exists
@@ -32,7 +35,8 @@ def seed_admin():
         if existing_admin:
             print(f"Admin user with email {ADMIN_EMAIL} already exists. Deleting and recreating...")
             db.delete(existing_admin)
-            db.commit()
+            # Flush rather than commit so the delete and re-insert share one transaction
+            db.flush()
 
         # Hash the password
         hashed_password = get_password_hash(ADMIN_PASSWORD)
@@ -48,7 +52,6 @@ def seed_admin():
 
         db.add(new_admin)
         db.commit()
-        db.refresh(new_admin)
 
         print(f"Admin user {ADMIN_EMAIL} created successfully.")
 
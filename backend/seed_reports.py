@@ -3,68 +3,61 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from bson import ObjectId
 import random
-from sqlalchemy.orm import Session
 
-from app.db.database import get_mongo_collection, SessionLocal
+from app.db.database import get_mongo_collection, SeedSessionLocal, bulk_insert, insert_missing
 from app.db.postgres_models import User, Item, Shop, Category, UserRole, ShopStatus
 
+_YANGON_TZ = ZoneInfo("Asia/Yangon")
+
+def seed_postgres_sync():
+    """Insert the PostgreSQL users, items and shops the sample reports reference"""
+    # One explicit transaction (committed on success, rolled back on error) holding one
+    # INSERT ... ON CONFLICT DO NOTHING per table, parents first. The sample rows are
+    # static, so existing ones are left untouched rather than re-written.
+    with SeedSessionLocal() as db, db.begin():
+        insert_missing(db, Category, [{"id": 1, "name": "Grains"}])
+        
+        insert_missing(db, User, [
+            {"id": 1, "full_name": "Ko Aung Aung", "email": "aung@example.com",
+             "hashed_password": "dummy", "role": UserRole.RETAILER},
+            {"id": 2, "full_name": "Ma Thida", "email": "thida@example.com",
+             "hashed_password": "dummy", "role": UserRole.CONTRIBUTOR},
+            {"id": 101, "full_name": "U Kyaw", "email": "kyaw@example.com",
+             "hashed_password": "dummy", "role": UserRole.USER},
+            {"id": 102, "full_name": "Daw Mya", "email": "mya@example.com",
+             "hashed_password": "dummy", "role": UserRole.USER},
+        ])
+        
+        insert_missing(db, Item, [
+            {"id": 1, "name": "Pawsan Hmwe Rice", "default_unit": "kg", "category_id": 1},
+            {"id": 2, "name": "Onion", "default_unit": "kg", "category_id": 1},
+            {"id": 3, "name": "Tomato", "default_unit": "kg", "category_id": 1},
+        ])
+        
+        insert_missing(db, Shop, [
+            {"id": 1, "shop_name": "ABC Groceries", "address_text": "Shwe Bo",
+             "owner_user_id": 1, "status": ShopStatus.VERIFIED},
+            {"id": 2, "shop_name": "XYZ Market", "address_text": "Mandalay",
+             "owner_user_id": 2, "status": ShopStatus.VERIFIED},
+        ])
+
 async def seed_reports():
     """Seed the database with sample report data for testing"""
     reports_collection = get_mongo_collection("reports")
     price_entries_collection = get_mongo_collection("price_entries")
     
-    # Clear existing reports and price entries
-    await reports_collection.delete_many({})
-    await price_entries_collection.delete_many({})
-    
-    # Create PostgreSQL session
-    db = SessionLocal()
-    
     try:
-        # Create sample category
-        category = Category(id=1, name="Grains")
-        db.merge(category)
-        
-        # Create sample users in PostgreSQL
-        users = [
-            User(id=1, full_name="Ko Aung Aung", email="aung@example.com", 
-                 hashed_password="dummy", role=UserRole.RETAILER),
-            User(id=2, full_name="Ma Thida", email="thida@example.com", 
-                 hashed_password="dummy", role=UserRole.CONTRIBUTOR),
-            User(id=101, full_name="U Kyaw", email="kyaw@example.com", 
-                 hashed_password="dummy", role=UserRole.USER),
-            User(id=102, full_name="Daw Mya", email="mya@example.com", 
-                 hashed_password="dummy", role=UserRole.USER)
-        ]
-        
-        for user in users:
-            db.merge(user)
-        
-        # Create sample items in PostgreSQL
-        items = [
-            Item(id=1, name="Pawsan Hmwe Rice", default_unit="kg", category_id=1),
-            Item(id=2, name="Onion", default_unit="kg", category_id=1),
-            Item(id=3, name="Tomato", default_unit="kg", category_id=1)
-        ]
-        
-        for item in items:
-            db.merge(item)
-        
-        # Create sample shops in PostgreSQL
-        shops = [
-            Shop(id=1, shop_name="ABC Groceries", address_text="Shwe Bo", 
-                 owner_user_id=1, status=ShopStatus.VERIFIED),
-            Shop(id=2, shop_name="XYZ Market", address_text="Mandalay", 
-                 owner_user_id=2, status=ShopStatus.VERIFIED)
-        ]
-        
-        for shop in shops:
-            db.merge(shop)
-        
-        db.commit()
+        # Clear existing reports and price entries while PostgreSQL is seeded on a
+        # worker thread; the two stores are independent, so their waits overlap
+        await asyncio.gather(
+            reports_collection.delete_many({}),
+            price_entries_collection.delete_many({}),
+            asyncio.to_thread(seed_postgres_sync),
+        )
         print("✅ Created PostgreSQL data: users, items, shops")
         
-        # Create price entries in MongoDB with all required fields
+        # Create price entries in MongoDB with all required fields; timestamps are offsets from one "now"
+        now = datetime.now(_YANGON_TZ)
         price_entries = []
         
         # Price entry 1 - for AI flag report
@@ -77,7 +70,7 @@ async def seed_reports():
             "unit": "MMK/kg",
             "shopId": 1,
             "submittedBy": {"id": 1, "role": "RETAILER"},
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")) - timedelta(hours=2),
+            "timestamp": now - timedelta(hours=2),
             "township_name": "Shwe Bo"
         }
         price_entries.append(price_entry_1)
@@ -92,13 +85,13 @@ async def seed_reports():
             "unit": "Kg",
             "shopId": 2,
             "submittedBy": {"id": 2, "role": "CONTRIBUTOR"},
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")) - timedelta(hours=1),
+            "timestamp": now - timedelta(hours=1),
             "township_name": "Chan Aye Tharzan"
         }
         price_entries.append(price_entry_2)
         
-        # Insert price entries into MongoDB
-        await price_entries_collection.insert_many(price_entries)
+        # Insert price entries into MongoDB in unordered batches (documents are independent)
+        await bulk_insert(price_entries_collection, price_entries, comment="seed_reports")
         print("✅ Created MongoDB price entries")
         
         # Create reports linked to price entries in MongoDB
@@ -111,7 +104,7 @@ async def seed_reports():
             "reasonForFlag": "AI_FLAG_PRICE_HIGH",
             "details": "AI Flag: Price is 40% above average",
             "status": "PENDING",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")) - timedelta(hours=1)
+            "timestamp": now - timedelta(hours=1)
         }
         sample_reports.append(ai_flag_report)
         
@@ -122,14 +115,14 @@ async def seed_reports():
             "reasonForFlag": "USER_SUGGESTION",
             "details": "User suggested price is 3400 Kg. Reason: I think so",
             "status": "PENDING",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")) - timedelta(minutes=30)
+            "timestamp": now - timedelta(minutes=30)
         }
         sample_reports.append(user_report)
         
         # Insert reports into MongoDB
         if sample_reports:
-            result = await reports_collection.insert_many(sample_reports)
-            print(f"✅ Created {len(result.inserted_ids)} MongoDB reports")
+            inserted = await bulk_insert(reports_collection, sample_reports, comment="seed_reports")
+            print(f"✅ Created {inserted} MongoDB reports")
             
             # Print summary
             pending_count = len([r for r in sample_reports if r["status"] == "PENDING"])
@@ -140,9 +133,6 @@ async def seed_reports():
             
     except Exception as e:
         print(f"❌ Error creating seed data: {e}")
-        db.rollback()
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     asyncio.run(seed_reports())
@@ -21,6 +21,8 @@ load_dotenv('config.env')
 MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
 MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'price_tracker_db')
 
+_YANGON_TZ = ZoneInfo("Asia/Yangon")
+
 async def seed_reviews():
     """Seed the database with sample reviews"""
     
@@ -36,42 +38,36 @@ async def seed_reviews():
     # First, let's check what users exist in PostgreSQL
     print("\n🔍 Checking existing users in PostgreSQL...")
     try:
-        from app.db.database import get_postgres_db
+        from app.db.database import SessionLocal
         from app.db import postgres_models as models
         
-        postgres_db = next(get_postgres_db())
-        
-        # Get existing users
-        existing_users = postgres_db.query(models.User).all()
-        print(f"📊 Found {len(existing_users)} users in PostgreSQL:")
-        
-        user_ids = []
-        for user in existing_users:
-            print(f"   - User ID: {user.id}, Name: {user.full_name}, Role: {user.role}")
-            user_ids.append(user.id)
+        # Only the first four user IDs are needed; the session closes as soon as they're read
+        with SessionLocal() as postgres_db:
+            review_user_ids = [
+                user_id
+                for (user_id,) in postgres_db.query(models.User.id).order_by(models.User.id).limit(4)
+            ]
         
-        postgres_db.close()
-        
-        if not user_ids:
+        if not review_user_ids:
             print("❌ No users found in PostgreSQL. Please create users first.")
             return
-            
-        # Use the first few user IDs for reviews
-        review_user_ids = user_ids[:4] if len(user_ids) >= 4 else user_ids
+        
+        print(f"📊 Using user IDs for reviews: {review_user_ids}")
         
     except Exception as e:
         print(f"❌ Error checking PostgreSQL users: {e}")
         print("⚠️ Using default user IDs (1, 2, 3, 4)")
         review_user_ids = [1, 2, 3, 4]
     
-    # Sample review data with real user IDs
+    # Sample review data with real user IDs (one shared timestamp is fine for seed data)
+    now = datetime.now(_YANGON_TZ)
     sample_reviews = [
         {
             "shopId": 1,  # Assuming shop ID 1 exists
             "userId": review_user_ids[0] if len(review_user_ids) > 0 else 1,
             "rating": 5,
             "comment": "Excellent service and great prices! Highly recommended.",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")),
+            "timestamp": now,
             "item_name": "Fresh Vegetables",
             "price": 5000
         },
@@ -80,7 +76,7 @@ async def seed_reviews():
             "userId": review_user_ids[1] if len(review_user_ids) > 1 else 2,
             "rating": 4,
             "comment": "Good quality products, friendly staff. Will visit again.",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")),
+            "timestamp": now,
             "item_name": "Organic Fruits",
             "price": 8000
         },
@@ -89,7 +85,7 @@ async def seed_reviews():
             "userId": review_user_ids[2] if len(review_user_ids) > 2 else 3,
             "rating": 5,
             "comment": "Best prices in town! Very fresh produce.",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")),
+            "timestamp": now,
             "item_name": "Rice",
             "price": 12000
         },
@@ -98,20 +94,34 @@ async def seed_reviews():
             "userId": review_user_ids[3] if len(review_user_ids) > 3 else 4,
             "rating": 3,
             "comment": "Decent prices but could improve on variety.",
-            "timestamp": datetime.now(ZoneInfo("Asia/Yangon")),
+            "timestamp": now,
             "item_name": "Cooking Oil",
             "price": 3500
         }
     ]
     
+    # Attach sentiment fields the same way the reviews API does, in one batch
+    try:
+        from app.services.sentiment_analysis import analyze_review_sentiments
+        
+        sentiments = analyze_review_sentiments([review["comment"] for review in sample_reviews])
+        for review, sentiment in zip(sample_reviews, sentiments):
+            review["sentiment_score"] = sentiment.get("polarity_score", 0.0)
+            review["sentiment_label"] = sentiment.get("overall_sentiment", "neutral")
+            review["sentiment_details"] = sentiment
+    except Exception as e:
+        print(f"⚠️ Skipping sentiment analysis: {e}")
+    
     try:
         # Clear existing reviews for shop 1
         await reviews_collection.delete_many({"shopId": 1})
         print("🧹 Cleared existing reviews for shop 1")
         
-        # Insert sample reviews
-        result = await reviews_collection.insert_many(sample_reviews)
-        print(f"✅ Inserted {len(result.inserted_ids)} sample reviews")
+        # Insert sample reviews in unordered batches (documents are independent)
+        from app.db.database import bulk_insert
+        
+        inserted = await bulk_insert(reviews_collection, sample_reviews, comment="seed_reviews")
+        print(f"✅ Inserted {inserted} sample reviews")
         
         # Verify the reviews were inserted
         count = await reviews_collection.count_documents({"shopId": 1})
@@ -3,8 +3,11 @@
 Comprehensive seed script to create test users for all roles
 """
 
+import argparse
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 
 # Add the app directory to the path so we can import models
@@ -14,13 +17,23 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 config_path = os.path.join(os.path.dirname(__file__), 'config.env')
 load_dotenv(dotenv_path=config_path)
 
-from app.db.database import get_postgres_db
+from sqlalchemy import insert, update
+
+# Seed data only needs cheap password hashes
+os.environ["SEED_MODE"] = "1"
+
+from app.db.database import SeedSessionLocal
 from app.db import postgres_models as models
 from app.core.security import get_password_hash
 
-def seed_test_users():
-    """Seed the database with test users for all roles"""
-    db = next(get_postgres_db())
+def seed_test_users(drop_indexes: bool = False):
+    """Seed the database with test users for all roles.
+
+    With drop_indexes, the non-unique indexes on users are dropped before the bulk
+    write and rebuilt once afterwards, in the same transaction. The unique email
+    index is always kept so duplicates are still rejected.
+    """
+    db = SeedSessionLocal()
     
     try:
         print("👥 Creating test users for all roles...")
@@ -106,72 +119,112 @@ def seed_test_users():
             }
         ]
         
-        created_users = []
-        updated_users = []
+        # Hash each distinct password once, up front and across processes; bcrypt is the
+        # dominant cost here. Sharing a hash (and salt) between accounts is only acceptable
+        # for throwaway seed data - registration always hashes with a fresh salt.
+        passwords = list(dict.fromkeys(user_data["password"] for user_data in test_users))
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            password_hashes = dict(zip(passwords, executor.map(get_password_hash, passwords)))
+        hashes = [password_hashes[user_data["password"]] for user_data in test_users]
         
-        for user_data in test_users:
-            # Check if user already exists
-            existing_user = db.query(models.User).filter(models.User.email == user_data["email"]).first()
+        # Look up all existing users in one query instead of one SELECT per user
+        emails = [user_data["email"] for user_data in test_users]
+        existing_users = {
+            row.email: row
+            for row in db.query(models.User.id, models.User.email, models.User.hashed_password)
+            .filter(models.User.email.in_(emails))
+        }
+        
+        new_rows = []
+        update_rows = []
+        
+        for user_data, hashed_password in zip(test_users, hashes):
+            existing_user = existing_users.get(user_data["email"])
             
             if existing_user:
                 print(f"⚠️ User {user_data['email']} already exists (ID: {existing_user.id})")
                 # Update the existing user with new data
-                existing_user.full_name = user_data["full_name"]
-                existing_user.role = user_data["role"]
-                existing_user.phone_number = user_data["phone_number"]
+                update_row = {
+                    "id": existing_user.id,
+                    "full_name": user_data["full_name"],
+                    "role": user_data["role"],
+                    "phone_number": user_data["phone_number"],
+                }
                 # Update password if it's different
                 if not existing_user.hashed_password or existing_user.hashed_password == "dummy":
-                    existing_user.hashed_password = get_password_hash(user_data["password"])
-                updated_users.append(existing_user)
-                print(f"   ✅ Updated user: {user_data['email']} (Role: {user_data['role']})")
+                    update_row["hashed_password"] = hashed_password
+                update_rows.append(update_row)
             else:
-                # Hash password
-                hashed_password = get_password_hash(user_data["password"])
-                
-                # Create user
-                new_user = models.User(
-                    email=user_data["email"],
-                    full_name=user_data["full_name"],
-                    hashed_password=hashed_password,
-                    phone_number=user_data["phone_number"],
-                    role=user_data["role"],
-                    status=models.UserStatus.ACTIVE
-                )
-                
-                db.add(new_user)
-                db.flush()  # Get the user ID
-                created_users.append(new_user)
-                print(f"✅ Created user: {user_data['email']} (ID: {new_user.id}, Role: {user_data['role']})")
+                new_rows.append({
+                    "email": user_data["email"],
+                    "full_name": user_data["full_name"],
+                    "hashed_password": hashed_password,
+                    "phone_number": user_data["phone_number"],
+                    "role": user_data["role"],
+                    "status": models.UserStatus.ACTIVE,
+                })
+        
+        deferred_indexes = []
+        if drop_indexes:
+            deferred_indexes = [index for index in models.User.__table__.indexes if not index.unique]
+            for index in deferred_indexes:
+                index.drop(db.connection(), checkfirst=True)
+        
+        # One multi-row INSERT for new users and one bulk UPDATE by primary key for existing ones
+        created_users = []
+        if new_rows:
+            created_users = db.execute(
+                insert(models.User).returning(models.User.id, models.User.email, models.User.role),
+                new_rows,
+            ).all()
+        if update_rows:
+            db.execute(update(models.User), update_rows)
+        
+        # Build each deferred index once over the final table instead of per inserted row
+        for index in deferred_indexes:
+            index.create(db.connection())
         
         db.commit()
         
+        for user in created_users:
+            print(f"✅ Created user: {user.email} (ID: {user.id}, Role: {user.role})")
+        for row in update_rows:
+            print(f"   ✅ Updated user ID {row['id']} (Role: {row['role']})")
+        updated_users = [
+            (user_data["email"], user_data["role"])
+            for user_data in test_users
+            if user_data["email"] in existing_users
+        ]
+        all_users = [(user.email, user.role) for user in created_users] + updated_users
+        
         print(f"\n🎉 Test users creation completed!")
         print(f"📊 Total users created: {len(created_users)}")
         print(f"📊 Total users updated: {len(updated_users)}")
-        print(f"📊 Total users available: {len(created_users) + len(updated_users)}")
+        print(f"📊 Total users available: {len(all_users)}")
+        
+        # Bucket emails by role in a single pass over the combined list
+        users_by_role = defaultdict(list)
+        for email, role in all_users:
+            users_by_role[role].append(email)
         
         print("\n📝 User credentials by role:")
         print("\n🔴 ADMIN Users:")
-        admin_users = [u for u in created_users + updated_users if u.role == models.UserRole.ADMIN]
-        for user in admin_users:
-            print(f"   - {user.email} / admin123")
+        for email in users_by_role[models.UserRole.ADMIN]:
+            print(f"   - {email} / admin123")
             
         print("\n🟡 CONTRIBUTOR Users:")
-        contributor_users = [u for u in created_users + updated_users if u.role == models.UserRole.CONTRIBUTOR]
-        for user in contributor_users:
-            print(f"   - {user.email} / contributor123")
+        for email in users_by_role[models.UserRole.CONTRIBUTOR]:
+            print(f"   - {email} / contributor123")
             
         print("\n🟢 RETAILER Users:")
-        retailer_users = [u for u in created_users + updated_users if u.role == models.UserRole.RETAILER]
-        for user in retailer_users:
-            print(f"   - {user.email} / retailer123")
+        for email in users_by_role[models.UserRole.RETAILER]:
+            print(f"   - {email} / retailer123")
             
         print("\n🔵 USER Users:")
-        user_users = [u for u in created_users + updated_users if u.role == models.UserRole.USER]
-        for user in user_users:
-            print(f"   - {user.email} / user123")
+        for email in users_by_role[models.UserRole.USER]:
+            print(f"   - {email} / user123")
         
-        return created_users + updated_users
+        return all_users
         
     except Exception as e:
         print(f"❌ Error creating test users: {e}")
@@ -181,8 +234,16 @@ def seed_test_users():
         db.close()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed test users for all roles")
+    parser.add_argument(
+        "--drop-indexes",
+        action="store_true",
+        help="drop non-unique users indexes during the bulk write and rebuild them afterwards",
+    )
+    args = parser.parse_args()
+    
     print("🌱 Starting test users seeding...")
-    seed_test_users()
+    seed_test_users(drop_indexes=args.drop_indexes)
 
 
 
@@ -7,9 +7,14 @@ This will:
 3. Verify notifications are stored in database
 """
 
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
+from sqlalchemy import case, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import raiseload
 
 # Add the app directory to the path so we can import models
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -23,12 +28,27 @@ from app.db.database import get_postgres_db
 from app.db import postgres_models as models
 from app.core.security import get_password_hash
 
-def create_test_users():
+# Dev/test-only cache of bcrypt hashes for the static test user passwords; never used by the app
+HASH_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.seed_hash_cache.json')
+
+def _load_hash_cache():
+    try:
+        with open(HASH_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_hash_cache(hashes):
+    try:
+        with open(HASH_CACHE_PATH, 'w') as f:
+            json.dump(hashes, f)
+    except OSError as e:
+        print(f"   ⚠️ Could not write password hash cache: {e}")
+
+def create_test_users(db):
     """Create admin and test users for testing"""
     print("👤 Creating test users...")
     
-    db = next(get_postgres_db())
-    
     try:
         # Test users to create
         test_users = [
@@ -62,35 +82,45 @@ def create_test_users():
             }
         ]
         
-        users_created = 0
+        # Hash each distinct password once, across processes; bcrypt dominates this step.
+        # Hashes from earlier runs come from the on-disk cache, so reruns skip bcrypt.
+        password_hashes = _load_hash_cache()
+        passwords = [
+            password
+            for password in dict.fromkeys(user_data["password"] for user_data in test_users)
+            if password not in password_hashes
+        ]
+        if passwords:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                password_hashes.update(zip(passwords, executor.map(get_password_hash, passwords)))
+            _save_hash_cache(password_hashes)
+        
+        with db.begin():
+            # Insert all test users in one statement; Postgres skips emails that already exist
+            stmt = pg_insert(models.User).values([
+                {
+                    "email": user_data["email"],
+                    "hashed_password": password_hashes[user_data["password"]],
+                    "full_name": user_data["full_name"],
+                    "role": user_data["role"],
+                    "status": user_data["status"],
+                }
+                for user_data in test_users
+            ]).on_conflict_do_nothing(index_elements=[models.User.email])
+            created_emails = set(db.scalars(stmt.returning(models.User.email)))
         
         for user_data in test_users:
-            # Check if user already exists
-            existing_user = db.query(models.User).filter(models.User.email == user_data["email"]).first()
-            
-            if existing_user:
+            if user_data["email"] in created_emails:
+                print(f"   ✓ Created user: {user_data['email']} ({user_data['role']})")
+            else:
                 print(f"   ✓ User {user_data['email']} already exists")
-                continue
-            
-            # Create new user
-            hashed_password = get_password_hash(user_data["password"])
-            
-            new_user = models.User(
-                email=user_data["email"],
-                hashed_password=hashed_password,
-                full_name=user_data["full_name"],
-                role=user_data["role"],
-                status=user_data["status"]
-            )
-            
-            db.add(new_user)
-            users_created += 1
-            print(f"   ✓ Created user: {user_data['email']} ({user_data['role']})")
+        users_created = len(created_emails)
         
-        db.commit()
-        
-        total_users = db.query(models.User).count()
-        active_users = db.query(models.User).filter(models.User.status == models.UserStatus.ACTIVE).count()
+        # Total and active user counts in a single query
+        total_users, active_users = db.query(
+            func.count(models.User.id),
+            func.count(case((models.User.status == models.UserStatus.ACTIVE, 1))),
+        ).one()
         
         print(f"   📊 Total users in database: {total_users}")
         print(f"   📊 Active users: {active_users}")
@@ -103,72 +133,65 @@ def create_test_users():
         db.rollback()
         return False
     finally:
-        db.close()
+        # End this step's transaction; the session itself belongs to main()
+        db.rollback()
 
-def test_broadcast_notifications():
+def test_broadcast_notifications(db):
     """Test creating broadcast notifications and verify they're stored"""
     print("\n📢 Testing broadcast notifications...")
     
-    db = next(get_postgres_db())
+    # Test announcement
+    test_title = "System Maintenance Announcement"
+    test_message = "The system will undergo maintenance from 2:00 PM to 4:00 PM today. Please save your work and log out during this time."
     
     try:
-        # Check users count
-        active_users = db.query(models.User).filter(models.User.status == models.UserStatus.ACTIVE).all()
-        notification_count_before = db.query(models.Notification).count()
-        
-        print(f"   📊 Active users found: {len(active_users)}")
-        print(f"   📊 Notifications before test: {notification_count_before}")
-        
-        if len(active_users) == 0:
-            print("   ❌ No active users found! Cannot test notifications.")
-            return False
-        
-        # Create test announcement
-        test_title = "System Maintenance Announcement"
-        test_message = "The system will undergo maintenance from 2:00 PM to 4:00 PM today. Please save your work and log out during this time."
-        
-        print(f"   📤 Creating broadcast notification:")
-        print(f"       Title: {test_title}")
-        print(f"       Message: {test_message[:50]}...")
-        
-        # Create notification for each active user (simulating the broadcast endpoint)
-        notifications_created = 0
-        
-        for user in active_users:
-            notification = models.Notification(
-                user_id=user.id,
-                title=test_title,
-                message=test_message,
-                category=models.NotificationCategory.SYSTEM,
-                read=False,
+        # Reads and the bulk insert share one transaction, committed when the block exits
+        with db.begin():
+            # Check users count
+            active_user_count = (
+                db.query(func.count(models.User.id))
+                .filter(models.User.status == models.UserStatus.ACTIVE)
+                .scalar()
             )
-            db.add(notification)
-            notifications_created += 1
+            notification_count_before = db.query(func.count(models.Notification.id)).scalar()
         
-        # Commit all notifications
-        db.commit()
+            print(f"   📊 Active users found: {active_user_count}")
+            print(f"   📊 Notifications before test: {notification_count_before}")
         
-        print(f"   ✅ Created {notifications_created} notifications")
+            if active_user_count == 0:
+                print("   ❌ No active users found! Cannot test notifications.")
+                return False
         
-        # Verify notifications were stored
-        notification_count_after = db.query(models.Notification).count()
-        new_notifications = notification_count_after - notification_count_before
+            print(f"   📤 Creating broadcast notification:")
+            print(f"       Title: {test_title}")
+            print(f"       Message: {test_message[:50]}...")
         
-        print(f"   📊 Notifications after test: {notification_count_after}")
-        print(f"   📊 New notifications created: {new_notifications}")
-        
-        # Check specific test notifications
-        test_notifications = db.query(models.Notification).filter(
-            models.Notification.title == test_title
-        ).all()
+            # Create notification for each active user (simulating the broadcast endpoint)
+            # with one INSERT ... SELECT: Postgres generates a row per active user, so no
+            # user IDs or notification rows cross the wire. RETURNING hands back the new
+            # IDs, so no re-count is needed.
+            active_users = select(
+                models.User.id,
+                literal(test_title),
+                literal(test_message),
+                literal(models.NotificationCategory.SYSTEM, models.Notification.category.type),
+                literal(False),
+            ).where(models.User.status == models.UserStatus.ACTIVE)
+            stmt = (
+                insert(models.Notification)
+                .from_select(["user_id", "title", "message", "category", "read"], active_users)
+                .returning(models.Notification.id)
+            )
+            created_ids = db.scalars(stmt).all()
         
-        print(f"   📊 Test notifications found in database: {len(test_notifications)}")
+        print(f"   ✅ Created {len(created_ids)} notifications")
+        print(f"   📊 Notifications after test: {notification_count_before + len(created_ids)}")
         
-        if len(test_notifications) == len(active_users):
+        if len(created_ids) == active_user_count:
             print("   ✅ SUCCESS: All active users received the notification!")
             return True
         else:
-            print(f"   ❌ MISMATCH: Expected {len(active_users)} notifications, found {len(test_notifications)}")
+            print(f"   ❌ MISMATCH: Expected {active_user_count} notifications, found {len(created_ids)}")
             return False
             
     except Exception as e:
@@ -176,63 +199,88 @@ def test_broadcast_notifications():
         db.rollback()
         return False
     finally:
-        db.close()
+        # End this step's transaction; the session itself belongs to main()
+        db.rollback()
 
-def show_database_status():
-    """Display current database status"""
+def show_database_status(db):
+    """Display current database status; returns False if any query (or lazy load) failed"""
     print("\n📊 Database Status:")
     print("=" * 40)
     
-    db = next(get_postgres_db())
-    
     try:
-        # Users
-        users = db.query(models.User).all()
-        print(f"👥 Users ({len(users)}):")
+        # Users (only the printed columns, streamed in batches)
+        user_count = db.query(func.count(models.User.id)).scalar()
+        print(f"👥 Users ({user_count}):")
+        users = db.query(
+            models.User.id, models.User.email, models.User.role, models.User.status
+        ).yield_per(500)
         for user in users:
             print(f"   ID: {user.id} | {user.email} | {user.role} | {user.status}")
         
-        # Notifications
-        notifications = db.query(models.Notification).order_by(models.Notification.created_at.desc()).all()
-        print(f"\n📢 Notifications ({len(notifications)}):")
+        # Notifications: count in SQL, fetch only the 10 most recent
+        notification_count = db.query(func.count(models.Notification.id)).scalar()
+        # raiseload: touching an unloaded relationship below raises instead of quietly
+        # issuing one extra query per row (an n+1), which fails this step
+        notifications = (
+            db.query(models.Notification)
+            .options(raiseload("*"))
+            .order_by(models.Notification.created_at.desc())
+            .limit(10)
+            .all()
+        )
+        print(f"\n📢 Notifications ({notification_count}):")
         if notifications:
-            for notif in notifications[:10]:  # Show last 10
+            for notif in notifications:
                 print(f"   ID: {notif.id} | User: {notif.user_id} | {notif.title[:30]}... | {notif.category} | Read: {notif.read}")
         else:
             print("   No notifications found")
             
         # Summary by category
-        system_notifs = db.query(models.Notification).filter(models.Notification.category == models.NotificationCategory.SYSTEM).count()
-        price_notifs = db.query(models.Notification).filter(models.Notification.category == models.NotificationCategory.PRICE).count()
+        category_counts = dict(
+            db.query(models.Notification.category, func.count())
+            .group_by(models.Notification.category)
+            .all()
+        )
+        system_notifs = category_counts.get(models.NotificationCategory.SYSTEM, 0)
+        price_notifs = category_counts.get(models.NotificationCategory.PRICE, 0)
         
         print(f"\n📈 Notification Summary:")
         print(f"   System notifications: {system_notifs}")
         print(f"   Price notifications: {price_notifs}")
         
+        return True
+        
     except Exception as e:
         print(f"❌ Error querying database: {e}")
+        return False
     finally:
-        db.close()
+        # End this step's transaction; the session itself belongs to main()
+        db.rollback()
 
 def main():
     print("🚀 Notification System Setup & Test")
     print("=" * 50)
     
-    # Step 1: Create users
-    users_success = create_test_users()
-    if not users_success:
-        print("❌ Failed to create users. Stopping.")
-        return
-    
-    # Step 2: Test notifications
-    notif_success = test_broadcast_notifications()
-    
-    # Step 3: Show final status
-    show_database_status()
+    # One session for every step instead of a new one per step
+    db = next(get_postgres_db())
+    try:
+        # Step 1: Create users
+        users_success = create_test_users(db)
+        if not users_success:
+            print("❌ Failed to create users. Stopping.")
+            sys.exit(1)
+        
+        # Step 2: Test notifications
+        notif_success = test_broadcast_notifications(db)
+        
+        # Step 3: Show final status
+        status_success = show_database_status(db)
+    finally:
+        db.close()
     
     # Final result
     print("\n" + "=" * 50)
-    if users_success and notif_success:
+    if users_success and notif_success and status_success:
         print("🎉 SUCCESS! Notification system is working!")
         print("\n✅ What happened:")
         print("   1. Test users were created/verified")
@@ -245,6 +293,7 @@ def main():
         print("\n🔗 API Endpoint: POST /api/notifications/broadcast")
     else:
         print("💥 Something went wrong. Check the errors above.")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -8,6 +8,9 @@ import os
 import sys
 import subprocess
 
+import psycopg2
+from psycopg2 import sql
+
 def check_postgres_installed():
     """Check if PostgreSQL is installed and accessible"""
     try:
@@ -27,23 +30,23 @@ def create_database():
     print("🔍 Creating database 'potato_db'...")
     
     try:
-        # Try to create the database
-        result = subprocess.run([
-            'createdb', '-U', 'postgres', 'potato_db'
-        ], capture_output=True, text=True)
+        # CREATE DATABASE can't run inside a transaction, hence autocommit
+        conn = psycopg2.connect(dbname='postgres', user='postgres')
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier('potato_db')))
+        finally:
+            conn.close()
         
-        if result.returncode == 0:
-            print("✅ Database 'potato_db' created successfully")
-            return True
-        elif "already exists" in result.stderr:
-            print("✅ Database 'potato_db' already exists")
-            return True
-        else:
-            print(f"❌ Failed to create database: {result.stderr}")
-            return False
-            
-    except FileNotFoundError:
-        print("❌ 'createdb' command not found. Please install PostgreSQL client tools.")
+        print("✅ Database 'potato_db' created successfully")
+        return True
+        
+    except psycopg2.errors.DuplicateDatabase:
+        print("✅ Database 'potato_db' already exists")
+        return True
+    except psycopg2.Error as e:
+        print(f"❌ Failed to create database: {e}")
         return False
 
 def test_connection():
@@ -51,19 +54,18 @@ def test_connection():
     print("🔍 Testing database connection...")
     
     try:
-        result = subprocess.run([
-            'psql', '-U', 'postgres', '-d', 'potato_db', '-c', 'SELECT 1 as test;'
-        ], capture_output=True, text=True)
+        conn = psycopg2.connect(dbname='potato_db', user='postgres')
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1 as test;')
+        finally:
+            conn.close()
         
-        if result.returncode == 0:
-            print("✅ Database connection test successful")
-            return True
-        else:
-            print(f"❌ Database connection test failed: {result.stderr}")
-            return False
-            
-    except FileNotFoundError:
-        print("❌ 'psql' command not found. Please install PostgreSQL client tools.")
+        print("✅ Database connection test successful")
+        return True
+        
+    except psycopg2.Error as e:
+        print(f"❌ Database connection test failed: {e}")
         return False
 
 def setup_database():
@@ -74,13 +76,36 @@ def setup_database():
         # Add the app directory to the path
         sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
         
+        from alembic import command
+        from alembic.config import Config
+        
+        from sqlalchemy import inspect
         from app.db.database import engine
-        from app.db.postgres_models import Base
         
-        # Create tables
-        Base.metadata.create_all(bind=engine)
+        alembic_cfg = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alembic.ini'))
+        
+        # Databases built before migrations existed (by create_all) already have the
+        # initial schema but no alembic_version table; mark them as at 0001 so the
+        # upgrade doesn't try to create those tables again
+        existing_tables = set(inspect(engine).get_table_names())
+        if "users" in existing_tables and "alembic_version" not in existing_tables:
+            print("ℹ️ Existing unversioned schema found, stamping it as revision 0001")
+            command.stamp(alembic_cfg, "0001")
+        
+        # Create tables by applying all Alembic migrations
+        command.upgrade(alembic_cfg, "head")
         print("✅ Database tables created successfully")
         
+        # MongoDB has no migrations; its indexes are created here instead
+        try:
+            import asyncio
+            from app.db.database import ensure_mongo_indexes
+            asyncio.run(ensure_mongo_indexes())
+            print("✅ MongoDB indexes created successfully")
+        except Exception as e:
+            print(f"⚠️ MongoDB index creation failed: {e}")
+            print("Re-run this script once MongoDB is reachable")
+        
         # Try to seed the database
         try:
             from app.main import seed_database
@@ -2,7 +2,7 @@ import asyncio
 import motor.motor_asyncio
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from zoneinfo import ZoneInfo
+from bson import ObjectId
 
 async def simple_test():
     """Simple test to check MongoDB directly"""
@@ -24,12 +24,20 @@ async def simple_test():
         
         # Test reports collection
         reports_collection = db["reports"]
-        all_reports = await reports_collection.find({}).to_list(length=100)
-        print(f"📊 Found {len(all_reports)} total reports")
+        # Only counts are needed for the totals; pending reports fetch just the printed fields
+        report_count = await reports_collection.count_documents({})
+        print(f"📊 Found {report_count} total reports")
         
-        pending_reports = await reports_collection.find({"status": "PENDING"}).to_list(length=100)
+        pending_reports = await reports_collection.find(
+            {"status": "PENDING"}, {"_id": 1, "status": 1, "details": 1, "timestamp": 1}
+        ).to_list(length=100)
         print(f"⏳ Found {len(pending_reports)} pending reports")
         
+        # Test price entries collection
+        price_entries_collection = db["price_entries"]
+        entry_count = await price_entries_collection.count_documents({})
+        print(f"💰 Found {entry_count} price entries")
+        
         if pending_reports:
             print("📋 Pending reports:")
             for report in pending_reports:
@@ -38,54 +46,55 @@ async def simple_test():
                 print(f"    Details: {report['details']}")
                 print(f"    Timestamp: {report['timestamp']}")
                 print()
-        else:
-            print("⚠️  No pending reports found!")
-            
-            # Create a simple test report
-            print("🔄 Creating a test pending report...")
-            test_report = {
-                "priceEntryId": "507f1f77bcf86cd799439011",  # Dummy ObjectId
-                "reportedByUserId": 1,
-                "reasonForFlag": "USER_SUGGESTION",
-                "details": "Test report - User suggested price is 4500 kg. Reason: This seems too high",
-                "status": "PENDING",
-                "timestamp": datetime.now(ZoneInfo("Asia/Yangon"))
-            }
-            
-            result = await reports_collection.insert_one(test_report)
-            print(f"✅ Created test report with ID: {result.inserted_id}")
-            
-            # Check again
-            new_pending = await reports_collection.find({"status": "PENDING"}).to_list(length=100)
-            print(f"📊 Now have {len(new_pending)} pending reports")
         
-        # Test price entries collection
-        price_entries_collection = db["price_entries"]
-        all_entries = await price_entries_collection.find({}).to_list(length=100)
-        print(f"💰 Found {len(all_entries)} price entries")
+        # Build any missing test documents client-side. The price entry's _id is generated
+        # here so the report can reference it up front instead of being patched afterwards.
+        now = datetime.now(ZoneInfo("Asia/Yangon"))
+        new_entries = []
+        new_reports = []
+        price_entry_id = "507f1f77bcf86cd799439011"  # Dummy ObjectId unless an entry is created
         
-        if not all_entries:
+        if not entry_count:
             print("🔄 Creating a test price entry...")
-            test_entry = {
+            price_entry_id = ObjectId()
+            new_entries.append({
+                "_id": price_entry_id,
                 "itemId": 1,
                 "type": "RETAIL",
                 "price": 5000.0,
                 "unit": "kg",
                 "shopId": 1,
                 "submittedBy": {"id": 1, "role": "USER"},
-                "timestamp": datetime.now(ZoneInfo("Asia/Yangon")),
+                "timestamp": now,
                 "township_name": "Test Township"
-            }
-            
-            entry_result = await price_entries_collection.insert_one(test_entry)
-            print(f"✅ Created test price entry with ID: {entry_result.inserted_id}")
+            })
+        
+        if not pending_reports:
+            print("⚠️  No pending reports found!")
+            print("🔄 Creating a test pending report...")
+            new_reports.append({
+                "priceEntryId": price_entry_id,
+                "reportedByUserId": 1,
+                "reasonForFlag": "USER_SUGGESTION",
+                "details": "Test report - User suggested price is 4500 kg. Reason: This seems too high",
+                "status": "PENDING",
+                "timestamp": now
+            })
+        
+        # One insert_many per collection, no follow-up update to link them
+        if new_entries:
+            await price_entries_collection.insert_many(new_entries, ordered=False)
+            print(f"✅ Created test price entry with ID: {price_entry_id}")
+        
+        if new_reports:
+            result = await reports_collection.insert_many(new_reports, ordered=False)
+            print(f"✅ Created test report with ID: {result.inserted_ids[0]}")
+            if new_entries:
+                print("✅ Test report references the new price entry")
             
-            # Update the test report to use this price entry
-            await reports_collection.update_one(
-                {"_id": result.inserted_id},
-                {"$set": {"priceEntryId": entry_result.inserted_id}}
-            )
-            print("✅ Updated test report to reference the price entry")
+            # Check again
+            new_pending = await reports_collection.count_documents({"status": "PENDING"})
+            print(f"📊 Now have {new_pending} pending reports")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -4,11 +4,20 @@ Test the notifications broadcast API endpoint
 """
 
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
 
 # API endpoint
 API_URL = "http://localhost:8000/api/notifications/broadcast"
 
+# One pooled keep-alive session for every request this script makes
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+def _pretty(data):
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
 def test_broadcast_api():
     """Test the broadcast notifications API endpoint"""
     
@@ -22,23 +31,22 @@ def test_broadcast_api():
     }
     
     print(f"📤 Sending POST request to: {API_URL}")
-    print(f"📋 Payload: {json.dumps(test_data, indent=2)}")
+    print(f"📋 Payload: {_pretty(test_data)}")
     
     try:
         # Make the API call
-        response = requests.post(
+        response = SESSION.post(
             API_URL,
-            json=test_data,
-            headers={"Content-Type": "application/json"},
+            data=orjson.dumps(test_data),
             timeout=10
         )
         
         print(f"\n📨 Response Status: {response.status_code}")
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             print(f"✅ Success Response:")
-            print(f"   {json.dumps(response_data, indent=2)}")
+            print(f"   {_pretty(response_data)}")
             
             # Verify we got expected fields
             if "notifications_created" in response_data:
@@ -55,7 +63,7 @@ def test_broadcast_api():
             print(f"   This means you need to be logged in as an admin")
             print(f"   The API requires admin authentication")
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 print(f"   Error: {error_data}")
             except:
                 print(f"   Raw response: {response.text}")
@@ -64,8 +72,8 @@ def test_broadcast_api():
         else:
             print(f"❌ API Error ({response.status_code}):")
             try:
-                error_data = response.json()
-                print(f"   Error: {json.dumps(error_data, indent=2)}")
+                error_data = orjson.loads(response.content)
+                print(f"   Error: {_pretty(error_data)}")
             except:
                 print(f"   Raw response: {response.text}")
             return False
@@ -84,7 +92,7 @@ def test_broadcast_api():
 def check_server_status():
     """Check if the server is running"""
     try:
-        response = requests.get("http://localhost:8000/", timeout=5)
+        response = SESSION.get("http://localhost:8000/", timeout=5)
         if response.status_code == 200:
             print("✅ Backend server is running")
             return True
@@ -1,21 +1,43 @@
+import asyncio
+import httpx
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+# One pooled keep-alive session for every request this script makes
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+BASE_URL = "http://localhost:8000"
+
+async def create_reports(reports):
+    """POST all reports concurrently over one pooled client (HTTP/2 where the server supports it)"""
+    async with httpx.AsyncClient(
+        http2=True,
+        base_url=BASE_URL,
+        headers={"Content-Type": "application/json"},
+        timeout=10,
+    ) as client:
+        return await asyncio.gather(
+            *(client.post("/api/reports/", content=orjson.dumps(report)) for report in reports)
+        )
+
 def test_api():
     """Test the reports API endpoints"""
-    base_url = "http://localhost:8000/api"
+    base_url = f"{BASE_URL}/api"
     
     print("🔍 Testing Reports API...")
     
     # Test the pending reports endpoint
     try:
-        response = requests.get(f"{base_url}/reports/queue/pending")
+        response = SESSION.get(f"{base_url}/reports/queue/pending")
         print(f"📊 Pending reports endpoint status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"📋 Found {len(data)} pending reports")
             
             if data:
@@ -27,30 +49,35 @@ def test_api():
             else:
                 print("⚠️  No pending reports found!")
                 
-                # Create a test report
+                # Create the test reports concurrently; the single-shot GETs stay on SESSION
                 print("🔄 Creating test report...")
-                test_report = {
-                    "priceEntryId": "507f1f77bcf86cd799439011",  # Dummy ObjectId
-                    "reportedByUserId": 1,
-                    "reasonForFlag": "USER_SUGGESTION",
-                    "details": "Test report - User suggested price is 4500 kg. Reason: This seems too high",
-                    "status": "PENDING",
-                    "timestamp": datetime.now(ZoneInfo("Asia/Yangon")).isoformat()
-                }
+                test_reports = [
+                    {
+                        "priceEntryId": "507f1f77bcf86cd799439011",  # Dummy ObjectId
+                        "reportedByUserId": 1,
+                        "reasonForFlag": "USER_SUGGESTION",
+                        "details": "Test report - User suggested price is 4500 kg. Reason: This seems too high",
+                        "status": "PENDING",
+                        "timestamp": datetime.now(ZoneInfo("Asia/Yangon")).isoformat()
+                    },
+                ]
                 
-                create_response = requests.post(f"{base_url}/reports/", json=test_report)
-                print(f"📝 Create report status: {create_response.status_code}")
+                create_responses = asyncio.run(create_reports(test_reports))
+                failed = [r for r in create_responses if r.status_code != 200]
+                for create_response in create_responses:
+                    print(f"📝 Create report status: {create_response.status_code}")
                 
-                if create_response.status_code == 200:
-                    print("✅ Test report created successfully!")
+                if not failed:
+                    print(f"✅ {len(create_responses)} test report(s) created successfully!")
                     
                     # Check again
-                    response2 = requests.get(f"{base_url}/reports/queue/pending")
+                    response2 = SESSION.get(f"{base_url}/reports/queue/pending")
                     if response2.status_code == 200:
-                        data2 = response2.json()
+                        data2 = orjson.loads(response2.content)
                         print(f"📊 Now have {len(data2)} pending reports")
                 else:
-                    print(f"❌ Failed to create report: {create_response.text}")
+                    for create_response in failed:
+                        print(f"❌ Failed to create report: {create_response.text}")
         else:
             print(f"❌ API error: {response.text}")
             
@@ -59,11 +86,11 @@ def test_api():
     
     # Test the general reports endpoint
     try:
-        response = requests.get(f"{base_url}/reports/")
+        response = SESSION.get(f"{base_url}/reports/")
         print(f"\n📊 General reports endpoint status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"📋 Found {len(data)} total reports")
         else:
             print(f"❌ API error: {response.text}")
@@ -24,8 +24,10 @@ def test_change_password_target():
         print("🔍 Testing Change Password Function Target")
         print("=" * 50)
         
-        # Get all users
-        users = db.query(models.User).all()
+        # Get all users (only the columns printed below; rows, not full User entities)
+        users = db.query(
+            models.User.id, models.User.email, models.User.role, models.User.full_name
+        ).all()
         
         if not users:
             print("❌ No users found in database")
@@ -40,7 +42,7 @@ def test_change_password_target():
         print("-" * 50)
         
         # Show what the OLD implementation would do (get first user)
-        first_user = db.query(models.User).first()
+        first_user = users[0]
         print(f"❌ OLD IMPLEMENTATION would change password for: User ID {first_user.id} ({first_user.email})")
         
         print("\n✅ NEW IMPLEMENTATION will change password for: The authenticated user (from JWT token)")
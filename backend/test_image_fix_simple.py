@@ -10,6 +10,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app.db.database import get_postgres_db
 from app.db import postgres_models as models
 
+# Base URL the API serves uploaded images from
+UPLOADS_URL_PREFIX = "http://localhost:8000/api/uploads/"
+
 def test_image_fix():
     """Test the image upload fix."""
     
@@ -19,7 +22,8 @@ def test_image_fix():
         print("🔍 Testing Image Upload Fix")
         print("=" * 40)
         
-        users = db.query(models.User).all()
+        # Only the columns printed below; rows, not full User entities
+        users = db.query(models.User.id, models.User.email, models.User.image_url).all()
         
         for user in users:
             print(f"\nUser ID: {user.id} | Email: {user.email}")
@@ -30,11 +34,11 @@ def test_image_fix():
                 if user.image_url.startswith('http'):
                     print(f"✅ Full URL: {user.image_url}")
                 elif user.image_url.startswith('uploads/'):
-                    constructed_url = f"http://localhost:8000/api/uploads/{user.image_url}"
+                    constructed_url = UPLOADS_URL_PREFIX + user.image_url
                     print(f"✅ Relative path -> Full URL: {constructed_url}")
                 else:
                     # This should be the most common case now (just filename)
-                    constructed_url = f"http://localhost:8000/api/uploads/{user.image_url}"
+                    constructed_url = UPLOADS_URL_PREFIX + user.image_url
                     print(f"✅ Filename -> Full URL: {constructed_url}")
             else:
                 print("❌ No image uploaded")
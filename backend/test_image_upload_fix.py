@@ -14,6 +14,9 @@ from app.db.database import get_postgres_db
 from app.db import postgres_models as models
 from sqlalchemy.orm import Session
 
+# Base URL the API serves uploaded images from
+UPLOADS_URL_PREFIX = "http://localhost:8000/api/uploads/"
+
 def test_image_urls():
     """Test how image URLs are stored and should be accessed."""
     
@@ -24,8 +27,8 @@ def test_image_urls():
         print("🔍 Testing Image Upload and URL Construction")
         print("=" * 60)
         
-        # Get all users
-        users = db.query(models.User).all()
+        # Get all users (only the columns printed below; rows, not full User entities)
+        users = db.query(models.User.id, models.User.email, models.User.image_url).all()
         
         if not users:
             print("❌ No users found in database")
@@ -40,7 +43,7 @@ def test_image_urls():
             
             if user.image_url:
                 # Show how the URL should be constructed
-                full_url = f"http://localhost:8000/api/uploads/{user.image_url}"
+                full_url = UPLOADS_URL_PREFIX + user.image_url
                 print(f"   Full URL should be: {full_url}")
             else:
                 print("   No image uploaded")
@@ -5,7 +5,11 @@ Debug script to test password hashing and verification
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -51,27 +55,41 @@ def test_password_system():
         current_verify = verify_password(test_password, user.hashed_password)
         print(f"🔍 Verification with stored hash: {current_verify}")
         
-        # If stored hash doesn't work, update it manually
-        if not current_verify:
-            print(f"\n🔧 Updating user password manually...")
-            user.hashed_password = new_hash
-            db.commit()
-            print(f"✅ Password updated in database")
-            
-            # Test again
-            updated_verify = verify_password(test_password, user.hashed_password)
-            print(f"🔍 Verification after update: {updated_verify}")
+        # The stored hash is already the test password's, so probing other passwords
+        # against it cannot match; skip the bcrypt-heavy probe below
+        if current_verify:
+            return True
+        
+        # Stored hash doesn't work, so update it manually
+        print(f"\n🔧 Updating user password manually...")
+        user.hashed_password = new_hash
+        db.commit()
+        print(f"✅ Password updated in database")
+        
+        # Test again
+        updated_verify = verify_password(test_password, user.hashed_password)
+        print(f"🔍 Verification after update: {updated_verify}")
+        if updated_verify:
+            return True
         
         # Test with a few common passwords to see what's stored
         common_passwords = ["password", "admin123", "user123", "123456", "password123"]
         print(f"\n🔍 Testing common passwords against stored hash:")
-        for pwd in common_passwords:
-            result = verify_password(pwd, user.hashed_password)
-            if result:
-                print(f"✅ Found matching password: '{pwd}'")
-                return True
-            else:
-                print(f"❌ '{pwd}' - no match")
+        # Each check is an independent bcrypt verification, so run them across processes
+        # and stop at the first match (checks that have not started yet are cancelled)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(verify_password, pwd, user.hashed_password): pwd
+                for pwd in common_passwords
+            }
+            for future in as_completed(futures):
+                pwd = futures[future]
+                if future.result():
+                    print(f"✅ Found matching password: '{pwd}'")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    return True
+                else:
+                    print(f"❌ '{pwd}' - no match")
         
         return True
         
@@ -86,8 +104,6 @@ def check_login_flow():
     print(f"\n🔑 Testing Login Flow")
     print("=" * 30)
     
-    import requests
-    
     # Test login with common credentials
     login_data = {
         "username": "admin@example.com",  # or whatever email you're using
@@ -95,11 +111,17 @@ def check_login_flow():
     }
     
     try:
-        response = requests.post(
-            "http://localhost:8000/api/auth/login",
-            data=login_data,  # OAuth2PasswordRequestForm expects form data
-            timeout=10
-        )
+        # Pooled keep-alive session, so any further calls here reuse the connection
+        with requests.Session() as session:
+            session.mount(
+                "http://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.2)),
+            )
+            response = session.post(
+                "http://localhost:8000/api/auth/login",
+                data=login_data,  # OAuth2PasswordRequestForm expects form data
+                timeout=10
+            )
         
         print(f"📨 Login response status: {response.status_code}")
         
@@ -8,6 +8,8 @@ import sys
 import requests
 import json
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -15,6 +17,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 # Load environment variables
 load_dotenv(dotenv_path='config.env')
 
+# One pooled keep-alive session for every request this script makes, with a few quick retries
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.2)),
+)
+
 def test_profile_update():
     """Test profile update functionality"""
 
@@ -35,7 +44,7 @@ def test_profile_update():
     try:
         # First, try to login to get a token
         print("🔐 Attempting to login...")
-        login_response = requests.post(
+        login_response = SESSION.post(
             f"{base_url}/api/auth/login",
             json={
                 "username": test_user_data["email"],
@@ -72,7 +81,7 @@ def test_profile_update():
             "Content-Type": "application/json"
         }
 
-        update_response = requests.put(
+        update_response = SESSION.put(
             f"{base_url}/api/users/me",
             json=update_data,
             headers=headers
@@ -89,7 +98,7 @@ def test_profile_update():
 
         # Test getting the updated user data
         print("\n📖 Testing get current user...")
-        me_response = requests.get(
+        me_response = SESSION.get(
             f"{base_url}/api/users/me",
             headers=headers
         )
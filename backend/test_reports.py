@@ -2,7 +2,10 @@ import asyncio
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from bson import ObjectId
-from app.db.database import get_mongo_collection, SessionLocal
+from app.db.database import (
+    get_mongo_collection, SessionLocal, insert_missing,
+    ensure_mongo_indexes, REPORTS_STATUS_TIMESTAMP_INDEX,
+)
 from app.db.postgres_models import User, Item, Shop, Category, UserRole, ShopStatus
 
 async def test_reports():
@@ -13,20 +16,26 @@ async def test_reports():
     try:
         reports_collection = get_mongo_collection("reports")
         price_entries_collection = get_mongo_collection("price_entries")
+        await ensure_mongo_indexes()
         print("✅ MongoDB collections accessible")
     except Exception as e:
         print(f"❌ MongoDB connection failed: {e}")
         return
     
-    # Check existing reports
+    # Check existing reports (counted server-side; only a few pending ones are fetched)
     try:
-        all_reports = await reports_collection.find({}).to_list(length=100)
-        print(f"📊 Found {len(all_reports)} total reports in database")
+        total_reports = await reports_collection.count_documents({})
+        print(f"📊 Found {total_reports} total reports in database")
         
-        pending_reports = await reports_collection.find({"status": "PENDING"}).to_list(length=100)
-        print(f"⏳ Found {len(pending_reports)} pending reports")
+        pending_count = await reports_collection.count_documents(
+            {"status": "PENDING"}, hint=REPORTS_STATUS_TIMESTAMP_INDEX
+        )
+        print(f"⏳ Found {pending_count} pending reports")
         
-        if pending_reports:
+        if pending_count:
+            pending_reports = await reports_collection.find(
+                {"status": "PENDING"}, {"status": 1, "details": 1}
+            ).limit(10).to_list(length=10)
             print("📋 Pending reports details:")
             for report in pending_reports:
                 print(f"  - ID: {report['_id']}, Status: {report['status']}, Details: {report['details']}")
@@ -39,36 +48,34 @@ async def test_reports():
     
     # Check price entries
     try:
-        all_price_entries = await price_entries_collection.find({}).to_list(length=100)
-        print(f"💰 Found {len(all_price_entries)} price entries in database")
+        price_entry_count = await price_entries_collection.count_documents({})
+        print(f"💰 Found {price_entry_count} price entries in database")
     except Exception as e:
         print(f"❌ Error checking price entries: {e}")
         return
     
     # If no pending reports, create some test data
-    if len(pending_reports) == 0:
+    if pending_count == 0:
         print("\n🔄 Creating test reports...")
         
-        # Create PostgreSQL session
-        db = SessionLocal()
-        
         try:
-            # Ensure we have basic data
-            category = Category(id=1, name="Grains")
-            db.merge(category)
-            
-            user = User(id=1, full_name="Test User", email="test@example.com", 
-                       hashed_password="dummy", role=UserRole.USER)
-            db.merge(user)
-            
-            item = Item(id=1, name="Test Rice", default_unit="kg", category_id=1)
-            db.merge(item)
-            
-            shop = Shop(id=1, shop_name="Test Shop", address_text="Test Location", 
-                       owner_user_id=1, status=ShopStatus.VERIFIED)
-            db.merge(shop)
-            
-            db.commit()
+            # Ensure we have basic data: one INSERT ... ON CONFLICT DO NOTHING per table,
+            # parents first, instead of merge()'s SELECT before each write. One explicit
+            # transaction, committed when the block exits (rolled back on error); the
+            # Mongo writes below run only after it has closed.
+            with SessionLocal() as db, db.begin():
+                insert_missing(db, Category, [{"id": 1, "name": "Grains"}])
+                insert_missing(db, User, [
+                    {"id": 1, "full_name": "Test User", "email": "test@example.com",
+                     "hashed_password": "dummy", "role": UserRole.USER},
+                ])
+                insert_missing(db, Item, [
+                    {"id": 1, "name": "Test Rice", "default_unit": "kg", "category_id": 1},
+                ])
+                insert_missing(db, Shop, [
+                    {"id": 1, "shop_name": "Test Shop", "address_text": "Test Location",
+                     "owner_user_id": 1, "status": ShopStatus.VERIFIED},
+                ])
             print("✅ Created PostgreSQL test data")
             
             # Create a test price entry
@@ -85,9 +92,6 @@ async def test_reports():
                 "township_name": "Test Township"
             }
             
-            await price_entries_collection.insert_one(price_entry)
-            print("✅ Created test price entry")
-            
             # Create a test pending report
             test_report = {
                 "priceEntryId": price_entry_id,
@@ -98,18 +102,21 @@ async def test_reports():
                 "timestamp": datetime.now(ZoneInfo("Asia/Yangon"))
             }
             
-            result = await reports_collection.insert_one(test_report)
+            # The report links to the entry by its client-generated _id, so both inserts
+            # (different collections) can be in flight at once
+            _, result = await asyncio.gather(
+                price_entries_collection.insert_one(price_entry),
+                reports_collection.insert_one(test_report),
+            )
+            print("✅ Created test price entry")
             print(f"✅ Created test pending report with ID: {result.inserted_id}")
             
             # Verify the report was created
-            new_pending_reports = await reports_collection.find({"status": "PENDING"}).to_list(length=100)
-            print(f"📊 Now have {len(new_pending_reports)} pending reports")
+            new_pending_count = await reports_collection.count_documents({"status": "PENDING"})
+            print(f"📊 Now have {new_pending_count} pending reports")
             
         except Exception as e:
             print(f"❌ Error creating test data: {e}")
-            db.rollback()
-        finally:
-            db.close()
 
 if __name__ == "__main__":
     asyncio.run(test_reports())
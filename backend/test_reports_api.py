@@ -4,6 +4,7 @@ Test script to verify reports API and database connectivity
 """
 
 import asyncio
+from operator import itemgetter
 import sys
 import os
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -20,86 +21,143 @@ load_dotenv('config.env')
 MONGO_URI = os.getenv('MONGO_URI', 'mongodb://localhost:27017')
 MONGO_DB_NAME = os.getenv('MONGO_DB_NAME', 'price_tracker_db')
 
+# One lazily-connecting client per process; its pool is shared by everything that calls
+# get_client(), and async I/O keeps a small pool sufficient
+_CLIENT = AsyncIOMotorClient(
+    MONGO_URI,
+    maxPoolSize=10,
+    minPoolSize=2,
+    serverSelectionTimeoutMS=2000,
+    connect=False,
+)
+
+# Printed in place of a field a report document does not have
+REPORT_DEFAULTS = {'reasonForFlag': 'N/A', 'status': 'N/A'}
+
+def get_client():
+    return _CLIENT
+
+def fetch_postgres_stats():
+    """Return the (users, items, shops) counts and up to three sample users' printed columns"""
+    from app.db.database import SessionLocal
+    
+    # The session hands its connection back to the pool even if a query raises
+    with SessionLocal() as db:
+        # These are trivial-column reads, so they go straight through the DBAPI cursor
+        # and skip SQLAlchemy's result/Row processing. Read-only: nothing to commit.
+        cursor = db.connection().connection.cursor()
+        try:
+            # Users, items and shops counted in a single round trip
+            cursor.execute(
+                "SELECT (SELECT COUNT(*) FROM users), (SELECT COUNT(*) FROM items), (SELECT COUNT(*) FROM shops)"
+            )
+            counts = cursor.fetchone()
+            
+            # Get sample users (only the printed columns)
+            cursor.execute("SELECT full_name, email, warning_count FROM users LIMIT 3")
+            sample_users = cursor.fetchall()
+        finally:
+            cursor.close()
+    return counts, sample_users
+
 async def test_reports_api():
     """Test the reports API and database connectivity"""
     
     print("🔍 Testing Reports API and Database Connectivity...")
     
+    # The PostgreSQL reads are independent of MongoDB, so they run on a worker thread
+    # while the MongoDB probes below are awaited; their waits overlap
+    postgres_task = asyncio.ensure_future(asyncio.to_thread(fetch_postgres_stats))
+    
     # Test MongoDB connection
     try:
-        client = AsyncIOMotorClient(MONGO_URI)
-        db = client[MONGO_DB_NAME]
+        db = get_client()[MONGO_DB_NAME]
         reports_collection = db['reports']
         price_entries_collection = db['price_entries']
         
         print("✅ Connected to MongoDB")
         
+        # Sample reports and the pending-report/price-entry join come back from one $facet
+        # aggregation. Both collection totals are unfiltered, so they come from collection
+        # metadata (estimated_document_count) rather than a full count; all three run together.
+        facet_pipeline = [
+            {"$facet": {
+                # Only the fields printed below are kept, so less BSON is built and sent
+                "sample": [
+                    {"$limit": 5},
+                    {"$project": {"reasonForFlag": 1, "status": 1}},
+                ],
+                "joined": [
+                    {"$match": {"status": "PENDING"}},
+                    {"$limit": 10},
+                    {"$project": {"reasonForFlag": 1, "priceEntryId": 1}},
+                    {"$lookup": {
+                        "from": "price_entries",
+                        "localField": "priceEntryId",
+                        "foreignField": "_id",
+                        "pipeline": [{"$project": {"price": 1}}],
+                        "as": "priceEntry"
+                    }},
+                    # Kept directly after $lookup so the two coalesce into one stage
+                    {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
+                ],
+            }}
+        ]
+        # $facet always yields exactly one document: read it straight off the cursor
+        # (batchSize=1, so the first batch holds it and no getMore follows)
+        facet, reports_count, price_entries_count = await asyncio.gather(
+            reports_collection.aggregate(facet_pipeline, batchSize=1).next(),
+            reports_collection.estimated_document_count(),
+            price_entries_collection.estimated_document_count(),
+        )
+        
         # Check reports collection
-        reports_count = await reports_collection.count_documents({})
         print(f"📊 Reports in database: {reports_count}")
         
         # Check price entries collection
-        price_entries_count = await price_entries_collection.count_documents({})
         print(f"📊 Price entries in database: {price_entries_count}")
         
         # Get sample reports
-        sample_reports = await reports_collection.find({}).limit(5).to_list(length=5)
+        sample_reports = facet["sample"]
         print(f"📝 Sample reports: {len(sample_reports)}")
         
-        for i, report in enumerate(sample_reports):
-            print(f"  Report {i+1}: {report.get('reasonForFlag', 'N/A')} - {report.get('status', 'N/A')}")
+        # Each listing is joined and written with one print call rather than one per document
+        if sample_reports:
+            # Missing fields fall back to 'N/A' via a defaults merge, then both come out in one C call
+            reason_and_status = itemgetter('reasonForFlag', 'status')
+            print("\n".join(
+                "  Report {}: {} - {}".format(i + 1, *reason_and_status({**REPORT_DEFAULTS, **report}))
+                for i, report in enumerate(sample_reports)
+            ))
         
         # Test aggregation pipeline
-        pipeline = [
-            {"$match": {"status": "PENDING"}},
-            {"$lookup": {
-                "from": "price_entries",
-                "localField": "priceEntryId",
-                "foreignField": "_id",
-                "as": "priceEntry"
-            }},
-            {"$unwind": {"path": "$priceEntry", "preserveNullAndEmptyArrays": True}}
-        ]
-        
-        aggregated_reports = await reports_collection.aggregate(pipeline).to_list(length=10)
+        aggregated_reports = facet["joined"]
         print(f"🔗 Aggregated reports with price entries: {len(aggregated_reports)}")
         
-        for i, report in enumerate(aggregated_reports):
-            price_entry = report.get('priceEntry', {})
-            print(f"  Aggregated {i+1}: {report.get('reasonForFlag', 'N/A')} - Price: {price_entry.get('price', 'N/A')}")
-        
-        client.close()
+        if aggregated_reports:
+            print("\n".join(
+                f"  Aggregated {i+1}: {report.get('reasonForFlag', 'N/A')} - Price: {report.get('priceEntry', {}).get('price', 'N/A')}"
+                for i, report in enumerate(aggregated_reports)
+            ))
         
     except Exception as e:
         print(f"❌ MongoDB test failed: {e}")
+        postgres_task.cancel()
         return False
     
-    # Test PostgreSQL connection
+    # Test PostgreSQL connection (its queries have been running alongside the MongoDB ones)
     try:
-        from app.db.database import SessionLocal
-        from app.db.postgres_models import User, Item, Shop
-        
-        db = SessionLocal()
-        
-        # Check users
-        users_count = db.query(User).count()
+        (users_count, items_count, shops_count), sample_users = await postgres_task
         print(f"👥 Users in PostgreSQL: {users_count}")
-        
-        # Check items
-        items_count = db.query(Item).count()
         print(f"📦 Items in PostgreSQL: {items_count}")
-        
-        # Check shops
-        shops_count = db.query(Shop).count()
         print(f"🏪 Shops in PostgreSQL: {shops_count}")
-        
-        # Get sample users
-        sample_users = db.query(User).limit(3).all()
         print(f"👤 Sample users: {len(sample_users)}")
-        for user in sample_users:
-            print(f"  User: {user.full_name} ({user.email}) - Warnings: {user.warning_count}")
+        if sample_users:
+            print("\n".join(
+                f"  User: {full_name} ({email}) - Warnings: {warning_count}"
+                for full_name, email, warning_count in sample_users
+            ))
         
-        db.close()
         print("✅ PostgreSQL test completed")
         
     except Exception as e:
@@ -110,4 +168,10 @@ async def test_reports_api():
     return True
 
 if __name__ == "__main__":
-    asyncio.run(test_reports_api())
+    from app.db.database import engine
+    
+    try:
+        asyncio.run(test_reports_api())
+    finally:
+        # Close the pooled Postgres connections before the interpreter exits
+        engine.dispose()
@@ -6,6 +6,7 @@ Test script to verify system announcements are working and storing in database
 import os
 import sys
 from dotenv import load_dotenv
+from sqlalchemy import func, insert, select
 
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
@@ -13,28 +14,54 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'app'))
 # Load environment variables
 load_dotenv(dotenv_path='config.env')
 
-from app.db.database import get_postgres_db
+from app.db.database import get_postgres_db, bulk_copy
 from app.db import postgres_models as models
 
-def check_notifications_before_and_after():
-    """Check notifications in database and show the difference"""
+# Active-user count at which the announcement is loaded with COPY instead of INSERT
+COPY_THRESHOLD = 10_000
+
+def fetch_active_user_ids():
+    """Return the IDs of all active users (nothing else about them is needed), streamed 1000 at a time"""
+    db = next(get_postgres_db())
+    try:
+        return [
+            user_id
+            for (user_id,) in db.execute(
+                select(models.User.id).where(models.User.status == models.UserStatus.ACTIVE)
+            ).yield_per(1000)
+        ]
+    finally:
+        db.close()
+
+def check_notifications_before_and_after(active_user_ids=None):
+    """Check notifications in database and show the difference
+
+    Pass active_user_ids when they are already known to skip counting active users again.
+    """
     
     print("🔍 Checking Notifications Database")
     print("=" * 40)
     
+    # Enum members used by the queries below, resolved once
+    SYSTEM = models.NotificationCategory.SYSTEM
+    PRICE = models.NotificationCategory.PRICE
+    ACTIVE = models.UserStatus.ACTIVE
+    
     db = next(get_postgres_db())
     
     try:
-        # Count current notifications
-        total_notifications = db.query(models.Notification).count()
-        system_notifications = db.query(models.Notification).filter(
-            models.Notification.category == models.NotificationCategory.SYSTEM
-        ).count()
-        price_notifications = db.query(models.Notification).filter(
-            models.Notification.category == models.NotificationCategory.PRICE
-        ).count()
-        
-        active_users = db.query(models.User).filter(models.User.status == models.UserStatus.ACTIVE).count()
+        # Count current notifications per category in one GROUP BY; the total is their sum
+        category_counts = dict(db.execute(
+            select(models.Notification.category, func.count()).group_by(models.Notification.category)
+        ).all())
+        total_notifications = sum(category_counts.values())
+        system_notifications = category_counts.get(SYSTEM, 0)
+        price_notifications = category_counts.get(PRICE, 0)
+        
+        if active_user_ids is None:
+            active_users = db.query(models.User).filter(models.User.status == ACTIVE).count()
+        else:
+            active_users = len(active_user_ids)
         
         print(f"📊 Current Database State:")
         print(f"   Total notifications: {total_notifications}")
@@ -44,7 +71,7 @@ def check_notifications_before_and_after():
         
         # Show recent system notifications
         recent_system = db.query(models.Notification).filter(
-            models.Notification.category == models.NotificationCategory.SYSTEM
+            models.Notification.category == SYSTEM
         ).order_by(models.Notification.created_at.desc()).limit(3).all()
         
         print(f"\n📢 Recent System Notifications:")
@@ -77,8 +104,11 @@ def check_notifications_before_and_after():
     finally:
         db.close()
 
-def create_test_system_notification():
-    """Create a test system notification to verify the functionality"""
+def create_test_system_notification(active_user_ids=None):
+    """Create a test system notification to verify the functionality
+
+    Pass active_user_ids when they are already known to skip fetching them again.
+    """
     
     print(f"\n🧪 Creating Test System Notification")
     print("=" * 40)
@@ -86,15 +116,15 @@ def create_test_system_notification():
     db = next(get_postgres_db())
     
     try:
-        # Get active users
-        active_users = db.query(models.User).filter(models.User.status == models.UserStatus.ACTIVE).all()
+        if active_user_ids is None:
+            active_user_ids = fetch_active_user_ids()
         
-        if not active_users:
+        if not active_user_ids:
             print("❌ No active users found! Cannot create notifications.")
             print("   Run: python seed_admin_users.py")
             return False
         
-        print(f"👥 Found {len(active_users)} active users")
+        print(f"👥 Found {len(active_user_ids)} active users")
         
         # Create test announcement (same as what the API would do)
         test_title = "Test System Announcement"
@@ -104,17 +134,31 @@ def create_test_system_notification():
         print(f"   Title: {test_title}")
         print(f"   Message: {test_message[:50]}...")
         
-        notifications_created = 0
-        for user in active_users:
-            notification = models.Notification(
-                user_id=user.id,
-                title=test_title,
-                message=test_message,
-                category=models.NotificationCategory.SYSTEM,
-                read=False,
+        category = models.NotificationCategory.SYSTEM
+        if len(active_user_ids) >= COPY_THRESHOLD:
+            # Very large cohorts are streamed in with a single COPY, skipping the
+            # per-statement parse/plan cost that even batched INSERTs pay
+            notifications_created = bulk_copy(
+                db,
+                models.Notification.__tablename__,
+                ("user_id", "title", "message", "category", "read"),
+                ((user_id, test_title, test_message, category, False) for user_id in active_user_ids),
             )
-            db.add(notification)
-            notifications_created += 1
+        else:
+            # One bulk INSERT instead of an ORM object per user; the engine's
+            # values_plus_batch mode pages it into 1000-row VALUES batches
+            rows = [
+                {
+                    "user_id": user_id,
+                    "title": test_title,
+                    "message": test_message,
+                    "category": category,
+                    "read": False,
+                }
+                for user_id in active_user_ids
+            ]
+            db.execute(insert(models.Notification), rows)
+            notifications_created = len(rows)
         
         db.commit()
         
@@ -132,16 +176,24 @@ if __name__ == "__main__":
     print("🚀 System Announcements Test")
     print("=" * 50)
     
+    # Active users don't change during the run: fetch them once for every step
+    # (on failure each step queries them itself and reports its own error)
+    try:
+        active_user_ids = fetch_active_user_ids()
+    except Exception as e:
+        print(f"❌ Could not fetch active users: {e}")
+        active_user_ids = None
+    
     # Check current state
-    before_stats = check_notifications_before_and_after()
+    before_stats = check_notifications_before_and_after(active_user_ids)
     
     if before_stats and before_stats['system'] == 0:
         print(f"\n❓ No system notifications found. Creating a test one...")
-        create_test_system_notification()
+        create_test_system_notification(active_user_ids)
         
         # Check again
         print(f"\n" + "=" * 50)
-        after_stats = check_notifications_before_and_after()
+        after_stats = check_notifications_before_and_after(active_user_ids)
         
         if after_stats and after_stats['system'] > before_stats['system']:
             print(f"\n🎉 SUCCESS! System notifications are working!")
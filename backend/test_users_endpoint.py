@@ -4,7 +4,16 @@ Simple test script to verify the users endpoint is working
 """
 
 import requests
-import json
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled keep-alive session shared by every request this script makes
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=Retry(total=1, backoff_factor=0)),
+)
 
 def test_users_endpoint():
     """Test the users endpoint"""
@@ -12,13 +21,13 @@ def test_users_endpoint():
     
     try:
         # Test the users endpoint
-        response = requests.get(f"{base_url}/api/users/")
+        response = SESSION.get(f"{base_url}/api/users/")
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
         
         if response.status_code == 200:
-            users = response.json()
+            users = orjson.loads(response.content)
             print(f"✅ Success! Found {len(users)} users:")
             for user in users:
                 print(f"  - {user.get('full_name', 'N/A')} ({user.get('email', 'N/A')}) - {user.get('role', 'N/A')}")